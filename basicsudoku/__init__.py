@@ -61,11 +61,94 @@ Some definitions used in this module:
 1 . 4 | . . . | . . .
 """
 
+import array
+import operator
+
 EMPTY_SPACE = '.'
+EMPTY_SPACE_BYTE = ord(EMPTY_SPACE) # the byte value for EMPTY_SPACE in SudokuBoard's bytearray
 BOARD_LENGTH = 9
 BOARD_LENGTH_SQRT = 3 # square root of BOARD_LENGTH
 FULL_BOARD_SIZE = BOARD_LENGTH * BOARD_LENGTH
 
+# Maps each symbol (and the empty space) to a bit in a 9-bit unit mask. The
+# empty space maps to 0 so that it never counts as a repeat.
+_SYMBOL_TO_BIT = {str(i): 1 << (i - 1) for i in range(1, BOARD_LENGTH + 1)}
+_SYMBOL_TO_BIT[EMPTY_SPACE] = 0
+_FULL_UNIT_MASK = (1 << BOARD_LENGTH) - 1 # a unit mask with all nine bits set
+
+# The same table keyed by the raw byte values in SudokuBoard's bytearray.
+_BYTE_TO_BIT = dict((ord(symbol), bit) for symbol, bit in _SYMBOL_TO_BIT.items())
+
+# Flat board indexes for every row, column, and box, precomputed so the
+# getters and is_valid_board() don't redo the index arithmetic per call.
+_ROW_IDX = tuple(tuple(y * BOARD_LENGTH + x for x in range(BOARD_LENGTH)) for y in range(BOARD_LENGTH))
+_COL_IDX = tuple(tuple(y * BOARD_LENGTH + x for y in range(BOARD_LENGTH)) for x in range(BOARD_LENGTH))
+_BOX_IDX = tuple(tuple((box_y * BOARD_LENGTH_SQRT + dy) * BOARD_LENGTH + (box_x * BOARD_LENGTH_SQRT + dx)
+                       for dy in range(BOARD_LENGTH_SQRT) for dx in range(BOARD_LENGTH_SQRT))
+                 for box_y in range(BOARD_LENGTH_SQRT) for box_x in range(BOARD_LENGTH_SQRT))
+_ALL_UNIT_IDX = _ROW_IDX + _COL_IDX + _BOX_IDX
+
+# One itemgetter per column and per box, baked from the index tables above.
+# Calling one fetches all nine of a unit's bytes from the flat board in a
+# single C-level call instead of a Python indexing loop. (Rows don't need
+# them; a row is a contiguous slice.)
+_COL_GETTERS = tuple(operator.itemgetter(*idx) for idx in _COL_IDX)
+_BOX_GETTERS = tuple(operator.itemgetter(*idx) for idx in _BOX_IDX)
+
+# The unit masks for the rows, columns, and boxes are kept packed in one
+# 27-entry list (rows 0-8, columns 9-17, boxes 18-26), so the hot loops do a
+# single attribute lookup for all three. This table maps every flat board
+# index to its three offsets in that list, replacing three integer divisions
+# with one tuple unpack.
+_CELL_TO_UNIT_IDX = tuple((i // BOARD_LENGTH,
+                           BOARD_LENGTH + i % BOARD_LENGTH,
+                           2 * BOARD_LENGTH + (i // BOARD_LENGTH // BOARD_LENGTH_SQRT) * BOARD_LENGTH_SQRT + (i % BOARD_LENGTH) // BOARD_LENGTH_SQRT)
+                          for i in range(FULL_BOARD_SIZE))
+
+# The empty board's bytes and unit masks, cached so clear() is just two
+# C-level copies instead of an encode and a list build.
+_EMPTY_BOARD_BYTES = bytes(EMPTY_SPACE * FULL_BOARD_SIZE, 'ascii')
+_EMPTY_UNIT_MASKS = array.array('H', bytes(2 * 3 * BOARD_LENGTH))
+
+
+def _check_unit_index(value, limit, name):
+    """Raises SudokuBoardException unless value is an int from 0 up to but
+    not including limit. The shared argument check for the public unit
+    getters; the exact type comparison is both cheaper than isinstance() and
+    rejects bools and floats alike."""
+    if type(value) is not int or not 0 <= value < limit:
+        raise SudokuBoardException('%s must be an int between 0 and %s' % (name, limit - 1))
+
+
+def _board_has_no_repeats(board):
+    """Returns True if the flat 81-byte board has no repeated symbol in any
+    of its 27 units. A module-level function rather than a method so the hot
+    loop runs on local variables only."""
+    for unit_indexes in _ALL_UNIT_IDX:
+        seen = 0
+        for i in unit_indexes:
+            bit = _BYTE_TO_BIT[board[i]]
+            if seen & bit:
+                return False
+            seen |= bit
+    return True
+
+
+# Every string a single space on the board can hold, for O(1) symbol checks.
+_VALID_SYMBOLS = frozenset(_SYMBOL_TO_BIT)
+
+# The nine symbols of a complete unit (no EMPTY_SPACE), for one-comparison
+# completeness checks.
+_COMPLETE_UNIT_SET = frozenset(str(i) for i in range(1, BOARD_LENGTH + 1))
+
+# The entire __str__ rendering as one 81-slot template, built from the
+# per-row format with the box separator lines in between. One format() call
+# on this template benchmarks over 2x faster than assembling the rows with
+# ' '.join() on symbol slices, so that's the strategy __str__ uses.
+_ROW_FMT = '{} {} {} | {} {} {} | {} {} {}'
+_SEPARATOR_LINE = '------+-------+------'
+_BOARD_FMT = '\n'.join([_ROW_FMT] * 3 + [_SEPARATOR_LINE] + [_ROW_FMT] * 3 + [_SEPARATOR_LINE] + [_ROW_FMT] * 3)
+
 class BareBonesSudokuBoard(object):
     def __init__(self, symbols=None):
         """Return a new data structure to represent a 9x9 Sudoku board.
@@ -261,7 +344,32 @@ class BareBonesSudokuBoard(object):
 
 
 
+class _UnitsView(object):
+    """A reusable iterable over one kind of unit (rows, columns, or boxes)
+    of a board. A view only holds the board method that fetches a unit by
+    index, so each board allocates at most one view per kind and iterating
+    always reflects the board's current symbols."""
+
+    __slots__ = ('_get_unit',)
+
+    def __init__(self, get_unit):
+        self._get_unit = get_unit
+
+
+    def __iter__(self):
+        # Yield the units one at a time, so a caller that stops early (like
+        # an any() or all() scan) never pays for the units it doesn't visit.
+        get_unit = self._get_unit
+        for i in range(BOARD_LENGTH):
+            yield get_unit(i)
+
+
 class SudokuBoard(object):
+    # Slots keep per-board memory down; a backtracking solver can hold
+    # thousands of candidate boards at once.
+    __slots__ = ('_strict', '_board', '_unit_masks', '_masks_dirty', '_str_cache',
+                 '_symbols_cache', '_valid_cache', '_rows_view', '_columns_view', '_boxes_view')
+
     def __init__(self, symbols=None, strict=True):
         """Return a new data structure to represent a 9x9 Sudoku board.
         SudokuBoard objects are mutable and can have their symbols modified
@@ -322,14 +430,12 @@ class SudokuBoard(object):
         >>> board.symbols
         '..1..............................................................................'
         """
-        all_symbols = []
-
-        # Loop over all 81 spaces on the board.
-        for y in range(BOARD_LENGTH):
-            for x in range(BOARD_LENGTH):
-                all_symbols.append(self._board[x][y])
-
-        return ''.join(all_symbols)
+        # The board is already the row-major ascii bytes of the symbols, so
+        # one decode produces the whole string, memoized until the board is
+        # mutated.
+        if self._symbols_cache is None:
+            self._symbols_cache = self._board.decode('ascii')
+        return self._symbols_cache
 
 
     @symbols.setter
@@ -341,19 +447,59 @@ class SudokuBoard(object):
         except TypeError:
             raise SudokuBoardException('symbols must be a sequence of 81 symbols')
 
-        # Check that all the symbols are valid.
-        for symbol in value:
-            if not self.is_valid_symbol(symbol):
-                raise SudokuBoardException('%r is not valid; symbols must be 1 to 9' % (repr(symbol)))
+        # A string input already yields single-character symbols, so only
+        # other sequences (which may hold ints) need the str() conversions.
+        if not isinstance(value, str):
+            value = [str(symbol) for symbol in value]
+
+        # One issuperset() call validates every symbol at C speed; the slow
+        # scan for the offending symbol only runs on the error path.
+        if not _VALID_SYMBOLS.issuperset(value):
+            symbol = next(symbol for symbol in value if symbol not in _VALID_SYMBOLS)
+            raise SudokuBoardException('%r is not valid; symbols must be 1 to 9' % (repr(symbol)))
+
+        # A non-strict assignment from a string doesn't need the masks (they
+        # are rebuilt on demand), so the board is a single ascii encode.
+        if isinstance(value, str) and not self._strict:
+            self._board = bytearray(value, 'ascii')
+            self._str_cache = None
+            self._symbols_cache = value
+            self._valid_cache = None
+            self._masks_dirty = True
+            return
+
+        # Fill in the new board and build the row, column, and box masks in a
+        # single pass over the input. The board is assembled in a local buffer
+        # so that a strict-mode repeat leaves the old board untouched until
+        # clear() runs.
+        board = bytearray(FULL_BOARD_SIZE)
+        masks = [0] * (3 * BOARD_LENGTH)
+        strict = self._strict
 
-        # Place the symbol on the board.
         for i, symbol in enumerate(value):
-            self._board[i % BOARD_LENGTH][i // BOARD_LENGTH] = symbol
-
-        # If the results in an invalid board while strict mode is enabled, raise an exception.
-        if self._strict and not self.is_valid_board():
-            self.clear()
-            raise SudokuBoardException('symbols results in an invalid board while strict mode is enabled')
+            bit = _SYMBOL_TO_BIT[symbol] # can't fail; the input was validated above
+            board[i] = ord(symbol)
+
+            row, col, box = _CELL_TO_UNIT_IDX[i]
+            if strict and (masks[row] | masks[col] | masks[box]) & bit:
+                # The symbol repeats one already in its row, column, or box.
+                self.clear()
+                raise SudokuBoardException('symbols results in an invalid board while strict mode is enabled')
+            masks[row] |= bit
+            masks[col] |= bit
+            masks[box] |= bit
+
+        self._board = board
+        self._str_cache = None
+        self._symbols_cache = value if isinstance(value, str) else None
+        self._valid_cache = True if strict else None
+        if strict:
+            self._unit_masks = array.array('H', masks)
+            self._masks_dirty = False
+        else:
+            # The input may contain duplicates, which the masks can't
+            # represent, so leave them to be rebuilt on demand.
+            self._masks_dirty = True
 
 
     def clear(self):
@@ -385,7 +531,52 @@ class SudokuBoard(object):
         . . . | . . . | . . .
         . . . | . . . | . . .
         """
-        self._board = [[EMPTY_SPACE] * BOARD_LENGTH for i in range(BOARD_LENGTH)] # create an empty board
+        # The board is a flat 81-byte bytearray of the ascii symbols, stored
+        # row-major: the space at (x, y) is at index y * 9 + x.
+        self._board = bytearray(_EMPTY_BOARD_BYTES) # create an empty board
+
+        # 9-bit masks of the symbols currently in each row, column, and box,
+        # packed into one unsigned-16-bit array (indexed through
+        # _CELL_TO_UNIT_IDX) and kept up
+        # to date by __setitem__() so strict mode can check an assignment
+        # without rescanning all 27 units. A non-strict write can put a
+        # duplicate symbol on the board, which the masks can't represent, so
+        # such writes just mark the masks dirty and they get rebuilt the next
+        # time strict mode needs them.
+        self._unit_masks = _EMPTY_UNIT_MASKS[:]
+        self._masks_dirty = False
+
+        # The rendered __str__ output and the decoded symbols string, each
+        # memoized until the board is mutated.
+        self._str_cache = None
+        self._symbols_cache = None
+
+        # The memoized is_valid_board() result; an empty board is valid.
+        self._valid_cache = True
+
+
+    def _rebuild_masks(self):
+        """Recomputes the row/column/box symbol masks from the board. This is
+        only ever done on a board with no repeated symbols, since the masks
+        have a single bit per symbol and can't represent repeats."""
+        # When numpy and numba are installed, the recompute runs as a
+        # compiled kernel over the board bytes.
+        from basicsudoku import _kernels
+        if _kernels.HAS_COMPILED_SOLVER:
+            masks, _ = _kernels.recompute_unit_masks(self._board)
+            self._unit_masks = array.array('H', masks)
+            self._masks_dirty = False
+            return
+
+        masks = [0] * (3 * BOARD_LENGTH)
+        for i, space in enumerate(self._board):
+            bit = _BYTE_TO_BIT[space]
+            row, col, box = _CELL_TO_UNIT_IDX[i]
+            masks[row] |= bit
+            masks[col] |= bit
+            masks[box] |= bit
+        self._unit_masks = array.array('H', masks)
+        self._masks_dirty = False
 
 
     def is_valid_symbol(self, symbol):
@@ -404,8 +595,9 @@ class SudokuBoard(object):
         >>> board.is_valid_symbol('01') # Symbols are only one character long.
         False
         """
-        symbol = str(symbol)
-        return len(symbol) == 1 and symbol in EMPTY_SPACE + '123456789'
+        # A set lookup also rules out multi-character strings, since only the
+        # ten single-character symbols are in the set.
+        return str(symbol) in _VALID_SYMBOLS
 
 
     def is_complete_unit(self, unit):
@@ -426,13 +618,22 @@ class SudokuBoard(object):
         >>> board.is_complete_unit('.........')
         False
         """
-        if not self.is_valid_unit(unit):
-            return False
-
-        if EMPTY_SPACE in unit:
-            return False # If there's an empty space, the unit can't be complete.
+        try:
+            if len(unit) != BOARD_LENGTH:
+                raise SudokuBoardException('unit must be a sequence with exactly 9 symbols, not %r' % (unit,))
+        except TypeError:
+            raise SudokuBoardException('unit must be a sequence with exactly 9 symbols, not %r' % (unit,))
 
-        return len(unit) == BOARD_LENGTH
+        # Nine symbols forming the full symbol set means there are no
+        # repeats and no empty spaces, all checked with one C-level set
+        # comparison.
+        unit_set = set(map(str, unit))
+        if unit_set == _COMPLETE_UNIT_SET:
+            return True
+        if not unit_set.issubset(_VALID_SYMBOLS):
+            bad_symbol = next(symbol for symbol in unit if str(symbol) not in _VALID_SYMBOLS)
+            raise SudokuBoardException('unit contains an invalid symbol: %r' % (bad_symbol,))
+        return False
 
 
     def is_valid_unit(self, unit):
@@ -462,17 +663,17 @@ class SudokuBoard(object):
         except TypeError:
             raise SudokuBoardException('unit must be a sequence with exactly 9 symbols, not %r' % (unit,))
 
-        # Check to make sure all the symbols in the unit are valid.
+        # Validate the symbols and check for repeats in a single pass, using
+        # a 9-bit mask of the symbols seen so far.
+        seen = 0
         for symbol in unit:
-            if not self.is_valid_symbol(symbol):
+            try:
+                bit = _SYMBOL_TO_BIT[str(symbol)]
+            except KeyError:
                 raise SudokuBoardException('unit contains an invalid symbol: %r' % (symbol,))
-
-        # Check for any repeat symbols in unit, aside from EMPTY_SPACE.
-        symbolSet = set()
-        for symbol in unit:
-            if symbol != EMPTY_SPACE and symbol in symbolSet:
+            if seen & bit:
                 return False
-            symbolSet.add(symbol)
+            seen |= bit
 
         return True
 
@@ -491,23 +692,34 @@ class SudokuBoard(object):
         False
         """
 
-        # Check each of the columns for validity.
-        for x in range(BOARD_LENGTH):
-            if not self.is_valid_unit(self.get_column(x)):
-                return False
+        # The board can only ever hold valid symbols, so only repeats need to
+        # be checked for, and the result is memoized until the board is
+        # mutated.
+        if self._valid_cache is None:
+            self._valid_cache = _board_has_no_repeats(self._board)
+        return self._valid_cache
 
-        # Check each of the rows for validity.
-        for y in range(BOARD_LENGTH):
-            if not self.is_valid_unit(self.get_row(y)):
-                return False
 
-        # Check each of the boxes for validity.
-        for top in range(BOARD_LENGTH_SQRT):
-            for left in range(BOARD_LENGTH_SQRT):
-                if not self.is_valid_unit(self.get_box(left, top)):
-                    return False # NOTE: It's really hard to get test coverage for this particular line. We'll need to find a board that passes the previous checks but fails here.
+    def as_array(self):
+        """Returns the board as a 9x9 numpy array of ints, with 0 for empty
+        spaces and 1 to 9 for the symbols. The array is a copy; modifying it
+        doesn't affect the board. Requires numpy to be installed."""
+        import numpy as np
 
-        return True
+        board_array = np.frombuffer(bytes(self._board), dtype=np.uint8).astype(np.int8)
+        board_array -= ord('0')
+        board_array[board_array < 0] = 0 # EMPTY_SPACE becomes 0
+        return board_array.reshape(BOARD_LENGTH, BOARD_LENGTH)
+
+
+    def fast_is_valid(self):
+        """Returns the same result as is_valid_board(), but runs the check as
+        a compiled kernel over the numpy array form of the board. Requires
+        numpy to be installed; if numba is also installed the kernel is
+        jit-compiled."""
+        from basicsudoku import _kernels
+
+        return _kernels.is_valid_board_array(self.as_array())
 
 
     def is_full(self):
@@ -524,11 +736,8 @@ class SudokuBoard(object):
         >>> board.is_full()
         True
         """
-        for x in range(BOARD_LENGTH):
-            for y in range(BOARD_LENGTH):
-                if self._board[x][y] == EMPTY_SPACE:
-                    return False
-        return True
+        # The in operator on a bytearray is a single C-level memchr scan.
+        return EMPTY_SPACE_BYTE not in self._board
 
 
     def is_solved(self):
@@ -545,7 +754,10 @@ class SudokuBoard(object):
         >>> board.is_solved()
         False
         """
-        return self.is_full() and self.is_valid_board()
+        # Inline the fullness test (a single memchr scan, see is_full()) so
+        # the common not-full case answers without a method call; the validity
+        # half is memoized by is_valid_board().
+        return EMPTY_SPACE_BYTE not in self._board and self.is_valid_board()
 
 
     def __getitem__(self, key):
@@ -592,22 +804,23 @@ class SudokuBoard(object):
 
         # If the key is a single integer (used for the iterable protocol)
         if isinstance(key, int):
-            if key < 0 or key >= FULL_BOARD_SIZE:
-                raise SudokuBoardException('key is out of range, must be between 0 and 80, inclusive')
-            return self._board[key % BOARD_LENGTH][key // BOARD_LENGTH]
+            if 0 <= key < FULL_BOARD_SIZE:
+                return chr(self._board[key])
+            raise SudokuBoardException('key is out of range, must be between 0 and 80, inclusive')
 
-        # Otherwise, if the key is a tuple or list of two ints.
-        if not isinstance(key, (tuple, list)) or len(key) != 2 or not isinstance(key[0], int) or not isinstance(key[1], int):
+        # Otherwise, the key is an (x, y) tuple. Unpacking it and indexing
+        # the board reject bad key types for us, instead of running a ladder
+        # of isinstance checks on every access.
+        try:
+            x, y = key
+            if 0 <= x < BOARD_LENGTH and 0 <= y < BOARD_LENGTH:
+                return chr(self._board[y * BOARD_LENGTH + x])
+        except (TypeError, ValueError):
             raise SudokuBoardException('key must be a tuple of two integers')
 
-        # Split the key into x and y coordinates.
-        x, y = key
-        if x < 0 or x >= BOARD_LENGTH:
+        if not 0 <= x < BOARD_LENGTH:
             raise SudokuBoardException('x index (%s) is out of range' % (x))
-        if y < 0 or y >= BOARD_LENGTH:
-            raise SudokuBoardException('y index (%s) is out of range' % (y))
-
-        return self._board[x][y]
+        raise SudokuBoardException('y index (%s) is out of range' % (y))
 
 
     def __setitem__(self, key, value):
@@ -653,36 +866,97 @@ class SudokuBoard(object):
         . . . | . . . | . . .
         . . . | . . . | . . 9
         """
-        # Check that the value is a valid symbol.
-        if not self.is_valid_symbol(value):
+        # Resolve the value to its single-character symbol string. A string
+        # input needs no conversion at all, and anything else (ints, mostly)
+        # pays str() once; the set lookup validates either way without the
+        # is_valid_symbol() method-call hop.
+        symbol = value if type(value) is str else str(value)
+        if symbol not in _VALID_SYMBOLS:
             raise SudokuBoardException('%r is not a valid symbol, symbols must be int or str between 1 and 9' % (value))
-        value = str(value)
+        value = symbol
 
         # If the key is a single integer (used for the iterable protocol)
         if isinstance(key, int):
-            if key < 0 or key >= FULL_BOARD_SIZE:
+            if not 0 <= key < FULL_BOARD_SIZE:
                 raise SudokuBoardException('key is out of range, must be between 0 and 80, inclusive')
-            key = (key % BOARD_LENGTH, key // BOARD_LENGTH)
-
-        elif not isinstance(key, (tuple, list)) or len(key) != 2 or not isinstance(key[0], int) or not isinstance(key[1], int):
-            raise SudokuBoardException('key must be a tuple of two integers')
-
-        # Split the key into x and y coordinates.
-        x, y = key
-        if x < 0 or x >= BOARD_LENGTH:
-            raise SudokuBoardException('x index (%s) is out of range' % (x))
-        if y < 0 or y >= BOARD_LENGTH:
-            raise SudokuBoardException('y index (%s) is out of range' % (y))
+            x, y = key % BOARD_LENGTH, key // BOARD_LENGTH
+            index = key
+        else:
+            # The key is an (x, y) tuple. Unpacking it and indexing the board
+            # reject bad key types for us, instead of running a ladder of
+            # isinstance checks on every assignment.
+            try:
+                x, y = key
+                x_in_range = 0 <= x < BOARD_LENGTH
+                y_in_range = 0 <= y < BOARD_LENGTH
+                if x_in_range and y_in_range:
+                    index = y * BOARD_LENGTH + x
+                    self._board[index] # rejects non-int coordinates for free
+            except (TypeError, ValueError):
+                raise SudokuBoardException('key must be a tuple of two integers')
+
+            if not x_in_range:
+                raise SudokuBoardException('x index (%s) is out of range' % (x))
+            if not y_in_range:
+                raise SudokuBoardException('y index (%s) is out of range' % (y))
+
+        if not self._strict:
+            # The write might put a duplicate on the board, which the masks
+            # can't represent, so mark them for a rebuild and set the space.
+            self._board[index] = ord(value)
+            self._masks_dirty = True
+            self._str_cache = None
+            self._symbols_cache = None
+            self._valid_cache = None
+            return
+
+        # Clearing a space can never violate strict mode, so skip straight to
+        # dropping the old symbol's bit from its units. This is the undo step
+        # a backtracking solver runs on every retracted guess.
+        if value == EMPTY_SPACE:
+            old_bit = _BYTE_TO_BIT[self._board[index]]
+            if not old_bit:
+                return # the space is already empty
+            if not self._masks_dirty:
+                masks = self._unit_masks
+                row, col, box = _CELL_TO_UNIT_IDX[index]
+                masks[row] &= ~old_bit
+                masks[col] &= ~old_bit
+                masks[box] &= ~old_bit
+            self._board[index] = EMPTY_SPACE_BYTE
+            self._str_cache = None
+            self._symbols_cache = None
+            self._valid_cache = None
+            return
+
+        # In strict mode, check the assignment against the incremental masks
+        # instead of rescanning all 27 units with is_valid_board().
+        if self._masks_dirty:
+            self._rebuild_masks()
+        masks = self._unit_masks
+        row, col, box = _CELL_TO_UNIT_IDX[index]
+        old_bit = _BYTE_TO_BIT[self._board[index]]
+        new_bit = _SYMBOL_TO_BIT[value]
+        if new_bit != old_bit:
+            # Clear the old symbol's bit, then make sure the new symbol isn't
+            # already elsewhere in this space's row, column, or box.
+            masks[row] &= ~old_bit
+            masks[col] &= ~old_bit
+            masks[box] &= ~old_bit
+            if new_bit and (masks[row] | masks[col] | masks[box]) & new_bit:
+                masks[row] |= old_bit # restore the masks
+                masks[col] |= old_bit
+                masks[box] |= old_bit
+                raise SudokuBoardException('strict mode is enabled, and this symbol assignment causes the board to become invalid')
+            masks[row] |= new_bit
+            masks[col] |= new_bit
+            masks[box] |= new_bit
 
         # Set the space to the new symbol.
-        old_value = self._board[x][y]
-        self._board[x][y] = value
-
-        # Do a board validity check if in strict mode.
-        if self._strict:
-            if not self.is_valid_board():
-                self._board[x][y] = old_value # restore old value
-                raise SudokuBoardException('strict mode is enabled, and this symbol assignment causes the board to become invalid')
+        self._board[index] = ord(value)
+        self._str_cache = None
+        self._symbols_cache = None
+        self._valid_cache = None
 
 
     def get_row(self, row):
@@ -710,10 +984,16 @@ class SudokuBoard(object):
         ['.', '.', '.', '.', '8', '.', '.', '7', '9']
         """
 
-        if not isinstance(row, int) or row < 0 or row >= BOARD_LENGTH:
-            raise SudokuBoardException('row must be an int between 0 and 8')
+        _check_unit_index(row, BOARD_LENGTH, 'row')
+        return self._get_row_unchecked(row)
 
-        return [self._board[x][row] for x in range(BOARD_LENGTH)]
+
+    def _get_row_unchecked(self, row):
+        # get_row() without the argument check, for internal callers whose
+        # indexes are generated in range. A row is a contiguous slice of the
+        # flat row-major board, and decoding the slice turns it into
+        # characters without a Python loop.
+        return list(self._board[row * BOARD_LENGTH:(row + 1) * BOARD_LENGTH].decode('ascii'))
 
 
     def get_column(self, column):
@@ -740,10 +1020,13 @@ class SudokuBoard(object):
         >>> board.get_column(8)
         ['.', '.', '.', '3', '1', '6', '.', '5', '9']
         """
-        if not isinstance(column, int) or column < 0 or column >= BOARD_LENGTH:
-            raise SudokuBoardException('column must be an int between 0 and 8')
+        _check_unit_index(column, BOARD_LENGTH, 'column')
+        return self._get_column_unchecked(column)
 
-        return [self._board[column][y] for y in range(BOARD_LENGTH)]
+
+    def _get_column_unchecked(self, column):
+        # get_column() without the argument check, for internal callers.
+        return [chr(space) for space in _COL_GETTERS[column](self._board)]
 
 
     def get_box(self, box_x, box_y):
@@ -774,22 +1057,16 @@ class SudokuBoard(object):
         """
 
         # Check that the x and y box coordinates are within range.
-        if not isinstance(box_x, int) or box_x < 0 or box_x >= BOARD_LENGTH_SQRT:
-            raise SudokuBoardException('box_x must be an int between 0 and 2')
-
-        if not isinstance(box_y, int) or box_y < 0 or box_y >= BOARD_LENGTH_SQRT:
-            raise SudokuBoardException('box_y must be an int between 0 and 2')
+        _check_unit_index(box_x, BOARD_LENGTH_SQRT, 'box_x')
+        _check_unit_index(box_y, BOARD_LENGTH_SQRT, 'box_y')
+        return self._get_box_unchecked(box_y * BOARD_LENGTH_SQRT + box_x)
 
-        # Get the 9 symbols from the box, starting at the top left and going
-        # right and then down.
-        box = []
-        start_x = box_x * BOARD_LENGTH_SQRT
-        start_y = box_y * BOARD_LENGTH_SQRT
-        for y in range(start_y, start_y + BOARD_LENGTH_SQRT):
-            for x in range(start_x, start_x + BOARD_LENGTH_SQRT):
-                box.append(self._board[x][y])
 
-        return box
+    def _get_box_unchecked(self, box):
+        # get_box() without the argument checks, taking a single box index
+        # that counts left to right and then down, 0 to 8. Returns the 9
+        # symbols from the box in the same order.
+        return [chr(space) for space in _BOX_GETTERS[box](self._board)]
 
 
     def get_box_of(self, x, y):
@@ -830,23 +1107,12 @@ class SudokuBoard(object):
         . . . | 4 1 9 | . . 5
         . . . | . 8 . | . 7 9
         """
-        all_rows = []
+        if self._str_cache is not None:
+            return self._str_cache
 
-        # Go through each row, gathering symbols for the string.
-        for y in range(BOARD_LENGTH):
-            row = self.get_row(y)
-
-            # Add vertical separators to the row.
-            row.insert(3, '|')
-            row.insert(7, '|')
-
-            all_rows.append(' '.join(row))
-
-            # Add a horizontal separator, if needed.
-            if y == 2 or y == 5:
-                all_rows.append('------+-------+------')
-
-        return '\n'.join(all_rows)
+        # One format() call drops all 81 symbols into the prebuilt template.
+        self._str_cache = _BOARD_FMT.format(*self.symbols)
+        return self._str_cache
 
 
     def __repr__(self):
@@ -856,12 +1122,25 @@ class SudokuBoard(object):
         >>> repr(board)
         "SudokuBoard(symbols='53..7....6..195....98....6.8...6...34..8.3..17...2...6.6....28....419..5....8..79', strict=True)"
         """
-        return "SudokuBoard(symbols=%r, strict=%r)" % (self.symbols, self._strict)
+        # An f-string formats directly in the bytecode, skipping the
+        # %-format parser.
+        return f"SudokuBoard(symbols={self.symbols!r}, strict={self._strict})"
 
 
     def __copy__(self):
         """Returns a copy of this object."""
-        board_copy = SudokuBoard(symbols=self.symbols, strict=self._strict)
+        # The source board is already known to be consistent, so copy its
+        # state directly instead of re-running the constructor's 81-symbol
+        # validation. Solvers copy a board on every search branch, making
+        # this the most-called method in a tree search.
+        board_copy = SudokuBoard.__new__(SudokuBoard)
+        board_copy._strict = self._strict
+        board_copy._board = bytearray(self._board)
+        board_copy._unit_masks = self._unit_masks[:]
+        board_copy._masks_dirty = self._masks_dirty
+        board_copy._str_cache = self._str_cache
+        board_copy._symbols_cache = self._symbols_cache
+        board_copy._valid_cache = self._valid_cache
         return board_copy
 
 
@@ -872,7 +1151,12 @@ class SudokuBoard(object):
 
 
     def copy(self):
-        """Returns a copy of this object."""
+        """Returns a copy of this object.
+
+        Note that copy.copy(board) and board.copy() are the faster ways to
+        clone a board; copy.deepcopy(board) produces the same result (a
+        SudokuBoard's deep copy is identical to its shallow copy) but pays
+        for the deepcopy machinery's memo bookkeeping on every call."""
         return self.__copy__()
 
 
@@ -883,11 +1167,15 @@ class SudokuBoard(object):
 
 
     def __iter__(self):
+        # Iterating the memoized symbols string hands out a C-level string
+        # iterator.
         return iter(self.symbols)
 
     @property
     def rows(self):
-        """Returns an iterator that iterates over the rows in this board.
+        """Returns a reusable iterable view of the rows in this board.
+        Each iteration over the view yields the rows one at a time,
+        reflecting the board's current symbols.
 
         >>> board = SudokuBoard(symbols='53..7....6..195....98....6.8...6...34..8.3..17...2...6.6....28....419..5....8..79')
         >>> for unit in board.rows:
@@ -903,11 +1191,18 @@ class SudokuBoard(object):
         ['.', '.', '.', '4', '1', '9', '.', '.', '5']
         ['.', '.', '.', '.', '8', '.', '.', '7', '9']
         """
-        return iter([self.get_row(i) for i in range(BOARD_LENGTH)])
+        # The view is allocated once per board and reused on every access.
+        try:
+            return self._rows_view
+        except AttributeError:
+            self._rows_view = _UnitsView(self._get_row_unchecked)
+            return self._rows_view
 
     @property
     def columns(self):
-        """Returns an iterator that iterates over the columns in this board.
+        """Returns a reusable iterable view of the columns in this board.
+        Each iteration over the view yields the columns one at a time,
+        reflecting the board's current symbols.
 
         >>> board = SudokuBoard(symbols='53..7....6..195....98....6.8...6...34..8.3..17...2...6.6....28....419..5....8..79')
         >>> for unit in board.columns:
@@ -923,11 +1218,17 @@ class SudokuBoard(object):
         ['.', '.', '6', '.', '.', '.', '8', '.', '7']
         ['.', '.', '.', '3', '1', '6', '.', '5', '9']
         """
-        return iter([self.get_column(i) for i in range(BOARD_LENGTH)])
+        try:
+            return self._columns_view
+        except AttributeError:
+            self._columns_view = _UnitsView(self._get_column_unchecked)
+            return self._columns_view
 
     @property
     def boxes(self):
-        """Returns an iterator that iterates over the boxes in this board.
+        """Returns a reusable iterable view of the boxes in this board.
+        Each iteration over the view yields the boxes one at a time,
+        reflecting the board's current symbols.
 
         >>> board = SudokuBoard(symbols='53..7....6..195....98....6.8...6...34..8.3..17...2...6.6....28....419..5....8..79')
         >>> for unit in board.boxes:
@@ -943,7 +1244,11 @@ class SudokuBoard(object):
         ['.', '.', '.', '4', '1', '9', '.', '8', '.']
         ['2', '8', '.', '.', '.', '5', '.', '7', '9']
         """
-        return iter([self.get_box(i % BOARD_LENGTH_SQRT, i // BOARD_LENGTH_SQRT) for i in range(BOARD_LENGTH)])
+        try:
+            return self._boxes_view
+        except AttributeError:
+            self._boxes_view = _UnitsView(self._get_box_unchecked)
+            return self._boxes_view
 
 
 class SudokuBoardException(Exception):
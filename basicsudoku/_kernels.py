@@ -0,0 +1,293 @@
+"""Optional compiled kernels for basicsudoku.
+
+These helpers operate on numpy integer arrays: the 9x9 boards produced
+by SudokuBoard.as_array() (0 for an empty space, 1 to 9 for symbols) and
+the flat 81-element candidate-mask arrays used by the solver. The module
+is only imported when one of the helpers is actually called, so numpy
+stays an optional dependency. If numba is also installed, the inner
+loops get jit-compiled for a large additional speedup; without numba the
+same functions run as plain Python.
+"""
+
+try:
+    import numpy as np
+except ImportError:
+    np = None
+
+if np is not None:
+    # The solver's peer and unit tables as numpy index arrays, built once at
+    # import. PEERS_ARRAY[i] holds the 20 peers of space i; UNITS_ARRAY[u]
+    # holds the 9 spaces of unit u. Besides feeding the compiled kernel,
+    # these support vectorized propagation directly: eliminating a digit bit
+    # from a space's peers is candidates[PEERS_ARRAY[i]] &= ~bit.
+    from basicsudoku.solvers import PEERS as _PEERS, UNITS as _UNITS
+    from basicsudoku import _CELL_TO_UNIT_IDX as _CELL_UNITS
+    PEERS_ARRAY = np.array(_PEERS, dtype=np.int64)
+    UNITS_ARRAY = np.array(_UNITS, dtype=np.int64)
+    CELL_UNITS_ARRAY = np.array(_CELL_UNITS, dtype=np.int64)
+else:
+    PEERS_ARRAY = None
+    UNITS_ARRAY = None
+    CELL_UNITS_ARRAY = None
+
+
+def _board_validity_kernel(board_array):
+    """Returns True if the 9x9 int array has no repeated symbol in any row,
+    column, or box. Written as plain integer loops so numba can compile it."""
+    for i in range(9):
+        row_mask = 0
+        col_mask = 0
+        box_mask = 0
+        for j in range(9):
+            # The ith row.
+            symbol = board_array[i, j]
+            if symbol != 0:
+                bit = 1 << (symbol - 1)
+                if row_mask & bit:
+                    return False
+                row_mask |= bit
+
+            # The ith column.
+            symbol = board_array[j, i]
+            if symbol != 0:
+                bit = 1 << (symbol - 1)
+                if col_mask & bit:
+                    return False
+                col_mask |= bit
+
+            # The ith box, going left to right and then down.
+            symbol = board_array[(i // 3) * 3 + j // 3, (i % 3) * 3 + j % 3]
+            if symbol != 0:
+                bit = 1 << (symbol - 1)
+                if box_mask & bit:
+                    return False
+                box_mask |= bit
+    return True
+
+
+def _solve_masks_kernel(candidates, peers, units):
+    """Depth-first search with naked-single and hidden-single propagation
+    over an 81-element int16 candidate-mask array, mutating it in place.
+    Returns True and leaves the solved masks in the array, or returns False
+    if there's no solution. Written as plain typed loops (including the
+    self-recursion) so numba can compile it."""
+    # Propagate until nothing changes: eliminate every solved space's digit
+    # from its peers (naked singles), and assign any digit that has exactly
+    # one place left in a unit (hidden singles), failing if any space runs
+    # out of candidates or any digit runs out of places.
+    changed = True
+    while changed:
+        changed = False
+        for i in range(81):
+            mask = candidates[i]
+            if mask == 0:
+                return False
+            if mask & (mask - 1) == 0:
+                for k in range(20):
+                    peer = peers[i, k]
+                    if candidates[peer] & mask:
+                        candidates[peer] &= ~mask
+                        if candidates[peer] == 0:
+                            return False
+                        changed = True
+
+        for u in range(27):
+            for digit in range(9):
+                bit = 1 << digit
+                places = 0
+                place = -1
+                for k in range(9):
+                    space = units[u, k]
+                    if candidates[space] & bit:
+                        places += 1
+                        place = space
+                if places == 0:
+                    return False
+                if places == 1 and candidates[place] != bit:
+                    candidates[place] = bit
+                    changed = True
+
+    # Find the unsolved space with the fewest candidates.
+    best_index = -1
+    best_count = 10
+    for i in range(81):
+        mask = candidates[i]
+        count = 0
+        while mask:
+            mask &= mask - 1
+            count += 1
+        if 1 < count < best_count:
+            best_index = i
+            best_count = count
+    if best_index == -1:
+        return True # every space is solved
+
+    # Try each candidate digit for that space on a snapshot of the state.
+    mask = candidates[best_index]
+    for digit in range(9):
+        bit = 1 << digit
+        if mask & bit:
+            snapshot = candidates.copy()
+            candidates[best_index] = bit
+            if _solve_masks_kernel(candidates, peers, units):
+                return True
+            candidates[:] = snapshot
+    return False
+
+
+def _recompute_masks_kernel(board, cell_units, masks):
+    """Rebuilds the 27 row/column/box bitmasks from the 81 ascii bytes of a
+    flat board buffer, writing them into the masks array. Returns True if no
+    row, column, or box holds a repeated symbol. Written as plain integer
+    loops so numba can compile it."""
+    ok = True
+    for i in range(81):
+        byte = board[i]
+        if byte != 46: # ord('.'), an empty space
+            bit = 1 << (byte - 49) # ord('1') maps to bit 0
+            for k in range(3):
+                unit = cell_units[i, k]
+                if masks[unit] & bit:
+                    ok = False
+                masks[unit] |= bit
+    return ok
+
+
+from basicsudoku.solvers import _DLX_HEADER_COUNT
+
+
+def _dlx_cover_kernel(left, right, up, down, column_of, size, column):
+    """Unlinks the column header and every row with a node in the column.
+    The compiled twin of DLXSolver._cover()."""
+    left[right[column]] = left[column]
+    right[left[column]] = right[column]
+    node = down[column]
+    while node != column:
+        row_node = right[node]
+        while row_node != node:
+            up[down[row_node]] = up[row_node]
+            down[up[row_node]] = down[row_node]
+            size[column_of[row_node]] -= 1
+            row_node = right[row_node]
+        node = down[node]
+
+
+def _dlx_uncover_kernel(left, right, up, down, column_of, size, column):
+    """Relinks a covered column and its rows, exactly reversing what
+    _dlx_cover_kernel() did."""
+    node = up[column]
+    while node != column:
+        row_node = left[node]
+        while row_node != node:
+            size[column_of[row_node]] += 1
+            up[down[row_node]] = row_node
+            down[up[row_node]] = row_node
+            row_node = left[row_node]
+        node = up[node]
+    left[right[column]] = column
+    right[left[column]] = column
+
+
+def _dlx_search_kernel(left, right, up, down, column_of, size, solution_out, solution_count):
+    """The dancing-links search over DLXSolver's parallel arrays, writing
+    chosen row ids into solution_out. Returns the total number of chosen
+    rows on success or -1 if this subtree has no solution. Written as plain
+    typed loops (including the self-recursion) so numba can compile it."""
+    if right[0] == 0:
+        return solution_count # every constraint is satisfied
+
+    # Choose the column with the fewest ways left to satisfy it.
+    best = right[0]
+    column = right[best]
+    while column != 0:
+        if size[column] < size[best]:
+            best = column
+        column = right[column]
+    if size[best] == 0:
+        return -1 # a constraint can no longer be satisfied
+
+    _dlx_cover_kernel(left, right, up, down, column_of, size, best)
+    node = down[best]
+    while node != best:
+        solution_out[solution_count] = (node - _DLX_HEADER_COUNT) // 4
+        row_node = right[node]
+        while row_node != node:
+            _dlx_cover_kernel(left, right, up, down, column_of, size, column_of[row_node])
+            row_node = right[row_node]
+
+        result = _dlx_search_kernel(left, right, up, down, column_of, size,
+                                    solution_out, solution_count + 1)
+        if result >= 0:
+            return result
+
+        row_node = left[node]
+        while row_node != node:
+            _dlx_uncover_kernel(left, right, up, down, column_of, size, column_of[row_node])
+            row_node = left[row_node]
+        node = down[node]
+    _dlx_uncover_kernel(left, right, up, down, column_of, size, best)
+    return -1
+
+
+HAS_COMPILED_SOLVER = False
+try:
+    from numba import njit
+    _board_validity_kernel = njit(cache=True)(_board_validity_kernel)
+    _solve_masks_kernel = njit(cache=True)(_solve_masks_kernel)
+    _recompute_masks_kernel = njit(cache=True)(_recompute_masks_kernel)
+    _dlx_cover_kernel = njit(cache=True)(_dlx_cover_kernel)
+    _dlx_uncover_kernel = njit(cache=True)(_dlx_uncover_kernel)
+    _dlx_search_kernel = njit(cache=True)(_dlx_search_kernel)
+    HAS_COMPILED_SOLVER = np is not None
+except ImportError:
+    pass # numba is optional; fall back to the plain Python loops.
+
+
+def is_valid_board_array(board_array):
+    """Returns True if the 9x9 int array is a valid (possibly incomplete)
+    sudoku board, otherwise returns False."""
+    return bool(_board_validity_kernel(board_array))
+
+
+def recompute_unit_masks(board):
+    """Takes the flat 81-byte board buffer of a SudokuBoard and rebuilds its
+    27 row/column/box bitmasks in one kernel pass. Returns a (masks, is_valid)
+    pair where masks is a list of 27 ints in SudokuBoard's _unit_masks layout
+    and is_valid reports whether any unit held a repeated symbol. Requires
+    numpy; meant to be used when HAS_COMPILED_SOLVER is True, since without
+    numba the plain-Python kernel is slower than the interpreter's own
+    rebuild loop."""
+    masks = np.zeros(27, dtype=np.uint16)
+    is_valid = bool(_recompute_masks_kernel(np.frombuffer(bytes(board), dtype=np.uint8),
+                                            CELL_UNITS_ARRAY, masks))
+    return [int(mask) for mask in masks], is_valid
+
+
+def solve_candidate_masks(masks):
+    """Takes a sequence of 81 candidate bitmasks (as produced by
+    BasicSolver), runs the compiled search kernel on it, and returns the
+    solved masks as a list, or None if the puzzle has no solution. Requires
+    numpy; meant to be used when HAS_COMPILED_SOLVER is True, since without
+    numba the plain-Python kernel is slower than BasicSolver itself."""
+    candidates = np.array(masks, dtype=np.int16)
+    if _solve_masks_kernel(candidates, PEERS_ARRAY, UNITS_ARRAY):
+        return [int(mask) for mask in candidates]
+    return None
+
+
+def dlx_search(left, right, up, down, column_of, size):
+    """Runs the compiled dancing-links search over DLXSolver's parallel
+    array.array buffers, shared with the kernel as zero-copy numpy views.
+    Returns the list of chosen row ids, or None if there's no solution.
+    Requires numpy; meant to be used when HAS_COMPILED_SOLVER is True."""
+    solution_out = np.empty(81, dtype=np.int64)
+    count = _dlx_search_kernel(np.frombuffer(left, dtype=np.int32),
+                               np.frombuffer(right, dtype=np.int32),
+                               np.frombuffer(up, dtype=np.int32),
+                               np.frombuffer(down, dtype=np.int32),
+                               np.frombuffer(column_of, dtype=np.int32),
+                               np.frombuffer(size, dtype=np.int32),
+                               solution_out, 0)
+    if count < 0:
+        return None
+    return [int(row_id) for row_id in solution_out[:count]]
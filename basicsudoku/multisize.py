@@ -59,13 +59,170 @@ Some definitions:
 1 . 4 | . . . | . . .
 """
 
+import array
+import collections
+import copy
 import doctest
+import functools
 import math
 
 EMPTY_SPACE = '.'
 
+# Empty prototype boards, one per size, that SudokuBoard.empty() copies
+# instead of re-running construction and validation. Populated lazily.
+_EMPTY_PROTOTYPES = {}
+
+
+@functools.lru_cache(maxsize=None)
+def _render_template(size):
+    """Returns a str.format() template for a board of the given size, with
+    the '|' and '-' separators baked in and one placeholder per space. The
+    template only depends on the board size, so it is built once and cached."""
+    size_sqrt = math.isqrt(size)
+    symbol_length = len(str(size_sqrt))
+
+    if size > 9:
+        placeholder = '{:>%s}' % (symbol_length)
+        vertical_separator = '|'.rjust(symbol_length)
+    else:
+        placeholder = '{}'
+        vertical_separator = '|'
+
+    all_rows = []
+    for y in range(size):
+        row = [placeholder] * size
+
+        # Add vertical separators to the row.
+        for i in range(size - 1 - size_sqrt, -1, -size_sqrt):
+            row.insert(i + 1, vertical_separator)
+
+        all_rows.append(' '.join(row))
+
+        # Add a horizontal separator, if needed.
+        if (y + 1) % size_sqrt == 0 and y != (size - 1):
+            all_rows.append(_horizontal_separator(size))
+
+    return '\n'.join(all_rows)
+
+
+@functools.lru_cache(maxsize=None)
+def _horizontal_separator(size):
+    """Returns the '------+-------+------' separator line that goes between
+    the subgrid rows for a board of the given size."""
+    size_sqrt = math.isqrt(size)
+    symbol_length = len(str(size_sqrt))
+    return ('-' * (symbol_length * size_sqrt + size_sqrt) +
+            '+' +
+            '-' * (symbol_length * size_sqrt + size_sqrt + 1) +
+            '+' +
+            '-' * (symbol_length * size_sqrt + size_sqrt))
+
+
+@functools.lru_cache(maxsize=None)
+def _row_indexes(size):
+    """Returns a tuple of tuples of the flat cell indexes of each row for
+    a board of the given size. Built once per size and cached."""
+    return tuple(tuple(y * size + x for x in range(size)) for y in range(size))
+
+
+@functools.lru_cache(maxsize=None)
+def _column_indexes(size):
+    """Returns a tuple of tuples of the flat cell indexes of each column
+    for a board of the given size. Built once per size and cached."""
+    return tuple(tuple(y * size + x for y in range(size)) for x in range(size))
+
+
+@functools.lru_cache(maxsize=None)
+def _subgrid_indexes(size):
+    """Returns a tuple of tuples of the flat cell indexes of each subgrid
+    (going left to right and then down) for a board of the given size.
+    Built once per size and cached."""
+    size_sqrt = math.isqrt(size)
+    return tuple(
+        tuple(y * size + x
+              for y in range(start_y, start_y + size_sqrt)
+              for x in range(start_x, start_x + size_sqrt))
+        for start_y in range(0, size, size_sqrt)
+        for start_x in range(0, size, size_sqrt)
+    )
+
+
+@functools.lru_cache(maxsize=None)
+def _all_group_indexes(size):
+    """Returns the rows, columns, and subgrids of a board of the given
+    size as one flat tuple of index tuples, for validators that check every
+    group the same way."""
+    return _row_indexes(size) + _column_indexes(size) + _subgrid_indexes(size)
+
+
+@functools.lru_cache(maxsize=None)
+def _cell_symbol_table(size):
+    """Returns a tuple mapping a cell bitmask's bit length to its symbol
+    string (so index 0, a zero cell, is EMPTY_SPACE) for a board of the
+    given size. Built once per size and cached."""
+    return (EMPTY_SPACE,) + tuple(str(digit) for digit in range(1, size + 1))
+
+
+@functools.lru_cache(maxsize=None)
+def _valid_symbol_set(size):
+    """Returns a frozenset of every valid symbol string for a board of the
+    given size (not including EMPTY_SPACE). Built once per size and cached."""
+    return frozenset(str(digit) for digit in range(1, size + 1))
+
+
+@functools.lru_cache(maxsize=None)
+def _symbol_cell_table(size):
+    """Returns a dict mapping each valid symbol string (and EMPTY_SPACE)
+    to its cell bitmask for a board of the given size. Built once per size
+    and cached."""
+    table = {EMPTY_SPACE: 0}
+    for digit in range(1, size + 1):
+        table[str(digit)] = 1 << (digit - 1)
+    return table
+
+
+# Every cached per-size table bundled together, so a board holds (and
+# looks up) just one reference for all of them.
+_SizeTables = collections.namedtuple('_SizeTables', [
+    'size_sqrt', 'valid_symbols', 'cell_symbols', 'symbol_cells',
+    'row_indexes', 'column_indexes', 'subgrid_indexes', 'all_group_indexes',
+    'render_template'])
+
+
+@functools.lru_cache(maxsize=None)
+def _tables_for_size(size):
+    """Returns the _SizeTables bundle for a board of the given size. Built
+    once per size and cached, like the individual tables it collects."""
+    return _SizeTables(math.isqrt(size), _valid_symbol_set(size),
+                       _cell_symbol_table(size), _symbol_cell_table(size),
+                       _row_indexes(size), _column_indexes(size),
+                       _subgrid_indexes(size), _all_group_indexes(size),
+                       _render_template(size))
+
+
+def _symbol_of_cell(cell):
+    """Returns the symbol string for an internal cell bitmask: the digit
+    whose bit is set, or EMPTY_SPACE for a zero cell."""
+    if cell == 0:
+        return EMPTY_SPACE
+    return str(cell.bit_length())
+
 
 class SudokuBoard(object):
+    def __new__(cls, symbols=None, size=9, strict=True, solved=False):
+        # Almost all boards are the default 9x9 size, so dispatch those to
+        # the specialized _SudokuBoard9 subclass.
+        if cls is SudokuBoard:
+            if symbols is not None:
+                try:
+                    size = math.isqrt(len(symbols))
+                except TypeError:
+                    pass # let __init__ raise the proper exception
+            if size == 9:
+                return object.__new__(_SudokuBoard9)
+        return object.__new__(cls)
+
+
     def __init__(self, symbols=None, size=9, strict=True, solved=False):
         """TODO
 
@@ -89,17 +246,55 @@ class SudokuBoard(object):
         """
 
         if symbols is not None:
-            size = int(math.sqrt(len(symbols)))
+            size = math.isqrt(len(symbols))
 
-        if not isinstance(size, int) or size < 0 or math.sqrt(size) % 1 != 0:
+        if not isinstance(size, int) or size < 0:
+            raise SudokuBoardException('SudokuBoard size must be a square integer, such as 9, 16, 25, etc')
+
+        # math.isqrt() is exact integer math, unlike math.sqrt() which could
+        # round off for large sizes.
+        size_sqrt = math.isqrt(size)
+        if size_sqrt * size_sqrt != size:
             raise SudokuBoardException('SudokuBoard size must be a square integer, such as 9, 16, 25, etc')
         self.size = size
-        self.size_sqrt = int(math.sqrt(self.size))
+        self.size_sqrt = size_sqrt
+        self._tables = _tables_for_size(size)
+        self._valid_symbols = self._tables.valid_symbols
 
         # When strict-mode is True, an exception will be raised if an illegal
         # symbol is placed on the board.
         self.strict = strict
-        self._board = [[EMPTY_SPACE] * self.size for i in range(self.size)] # create an empty board
+
+        # Each space is stored as an integer bitmask in a flat row-major
+        # array: the space at (x, y) is at index y * size + x, holding
+        # 1 << (digit - 1) for a set symbol and 0 for an empty space.
+        # Validating a group is then an OR and a duplicate-bit test over
+        # plain integers instead of string comparisons, and symbols are
+        # only built at the getter/setter boundary.
+        self._cells = array.array('L', [0] * (self.size * self.size)) # create an empty board
+
+        # The symbols already used in each row, column, and subgrid, as
+        # integer bitmasks, so that strict mode can check an assignment
+        # against three ints instead of revalidating the whole board.
+        # Writes made while strict mode is off only set the dirty flag, and
+        # the masks are rebuilt from the cells the next time they're needed.
+        self._row_used = [0] * self.size
+        self._col_used = [0] * self.size
+        self._box_used = [0] * self.size
+        self._used_masks_dirty = False
+
+        # The row/column/subgrid views are cached and only rebuilt after the
+        # board has been modified.
+        self._dirty = True
+        self._row_cache = None
+        self._column_cache = None
+        self._subgrid_cache = None
+
+        # The rendered __str__() and __repr__() strings are also cached,
+        # since they're often asked for repeatedly (logging, debugging)
+        # between modifications.
+        self._str_cache = None
+        self._repr_cache = None
 
         if symbols is not None:
             # Fill in the spaces with the provided symbols.
@@ -109,34 +304,50 @@ class SudokuBoard(object):
             if len(symbols) != self.size ** 2:
                 raise SudokuBoardException('symbols argument must contain %s symbols' % (self.size ** 2))
 
-            for i, symbol in enumerate(symbols):
-                symbol = str(symbol)
-                if not self.is_valid_symbol(symbol):
+            table = self._tables.symbol_cells
+            if isinstance(symbols, str):
+                # One set difference validates every character at once, and
+                # the cells then fill in a single bulk-translating pass.
+                bad_symbols = set(symbols) - set(table)
+                if bad_symbols:
+                    symbol = next(symbol for symbol in symbols if symbol in bad_symbols)
                     raise SudokuBoardException('%r is not a valid symbol for a %s x %s board' % (repr(symbol), self.size, self.size))
-                self._board[i % self.size][i // self.size] = symbol
+                self._cells = array.array('L', [table[symbol] for symbol in symbols])
+            else:
+                for i, symbol in enumerate(symbols):
+                    symbol = str(symbol)
+                    cell = table.get(symbol)
+                    if cell is None:
+                        raise SudokuBoardException('%r is not a valid symbol for a %s x %s board' % (repr(symbol), self.size, self.size))
+                    self._cells[i] = cell
+            self._used_masks_dirty = True
 
         if solved:
             self.solve()
 
 
     def is_valid_symbol(self, symbol):
-        if symbol == EMPTY_SPACE:
-            return True
-
-        if not str(symbol).isdigit():
-            return False
-
-        return symbol == EMPTY_SPACE or 1 <= int(symbol) <= self.size
+        # Membership in the precomputed per-size set is a single hash
+        # lookup, with no int parsing and no exception path for junk input.
+        return symbol == EMPTY_SPACE or str(symbol) in self._valid_symbols
 
 
     def is_complete_group(self, group):
-        if not self.is_valid_group(group):
-            return False
-
-        if EMPTY_SPACE in group:
-            return False
+        try:
+            if len(group) != self.size:
+                raise SudokuBoardException('group must be a sequence with exactly %s items' % (self.size))
+        except TypeError:
+            raise SudokuBoardException('group must be a sequence with exactly %s items' % (self.size))
 
-        return len(set(group)) == len(group)
+        # A group of size symbols is complete exactly when its symbols, as
+        # a set, equal the full symbol set: that implies no empty spaces
+        # and no repeats, all checked with C-level set operations.
+        group_set = set(map(str, group))
+        if group_set == self._valid_symbols:
+            return True
+        if group_set.difference(self._valid_symbols, EMPTY_SPACE):
+            raise SudokuBoardException('group contains an invalid symbol')
+        return False
 
 
     def is_valid_group(self, group):
@@ -146,15 +357,18 @@ class SudokuBoard(object):
         except TypeError:
             raise SudokuBoardException('group must be a sequence with exactly %s items' % (self.size))
 
+        # Validate each symbol and check for repeats in a single pass. The
+        # symbols seen so far are tracked as bits in an integer bitmask.
+        seen = 0
         for symbol in group:
+            if symbol == EMPTY_SPACE:
+                continue
             if not self.is_valid_symbol(symbol):
                 raise SudokuBoardException('group contains an invalid symbol')
-
-        symbolSet = set()
-        for symbol in group:
-            if symbol != EMPTY_SPACE and symbol in symbolSet:
+            bit = 1 << (int(symbol) - 1)
+            if seen & bit:
                 return False
-            symbolSet.add(symbol)
+            seen |= bit
 
         return True
 
@@ -164,31 +378,27 @@ class SudokuBoard(object):
         otherwise return False if the board has invalid symbols set to any of the
         spaces."""
 
-        # Check each of the columns for validity.
-        for x in range(self.size):
-            if not self.is_valid_group(self.get_column(x)):
-                return False
-
-        # Check each of the rows for validity.
-        for y in range(self.size):
-            if not self.is_valid_group(self.get_row(y)):
-                return False
-
-        # Check each of the subgrids for validity.
-        for top in range(self.size_sqrt):
-            for left in range(self.size_sqrt):
-                if not self.is_valid_group(self.get_subgrid(left, top)):
+        # The setters only allow valid symbols on the board, so only repeated
+        # symbols within a group need to be checked for, which the cell
+        # bitmasks reduce to an OR and a duplicate-bit test per group. The
+        # groups come from the precomputed per-size index tables, so there
+        # is no coordinate arithmetic here at all.
+        cells = self._cells
+        for group in self._tables.all_group_indexes:
+            seen = 0
+            for index in group:
+                cell = cells[index]
+                if seen & cell:
                     return False
+                seen |= cell
 
         return True
 
 
     def is_full(self):
-        for x in range(self.size):
-            for y in range(self.size):
-                if self._board[x][y] == EMPTY_SPACE:
-                    return False
-        return True
+        # An empty space is a zero cell, and the `in` operator scans the
+        # cell array at C level.
+        return 0 not in self._cells
 
 
     def is_solved(self):
@@ -197,87 +407,148 @@ class SudokuBoard(object):
 
 
     def __getitem__(self, key):
-        if not isinstance(key , tuple) or len(key) != 2 or not isinstance(key[0], int) or not isinstance(key[1], int):
+        # A single unpack-and-compare is much cheaper than separate
+        # isinstance checks on the key and both of its parts; the indexing
+        # itself rejects non-integer coordinates.
+        size = self.size
+        try:
+            x, y = key
+            if 0 <= x < size and 0 <= y < size:
+                return _symbol_of_cell(self._cells[y * size + x])
+        except (TypeError, ValueError):
             raise SudokuBoardException('key must be a tuple of two integers')
 
-        x, y = key
-        if x < 0 or x >= self.size:
-            raise SudokuBoardException('x index (%s) is out of range' % (x))
-        if y < 0 or y >= self.size:
-            raise SudokuBoardException('y index (%s) is out of range' % (y))
-
-        return self._board[x][y]
+        raise SudokuBoardException('(%s, %s) index is out of range' % (x, y))
 
 
     def __setitem__(self, key, value):
-        if not isinstance(key , tuple) or len(key) != 2 or not isinstance(key[0], int) or not isinstance(key[1], int):
-            raise SudokuBoardException('key must be a tuple of two integers')
-
-        x, y = key
-        if x < 0 or x >= self.size:
-            raise SudokuBoardException('x index (%s) is out of range' % (x))
-        if y < 0 or y >= self.size:
-            raise SudokuBoardException('y index (%s) is out of range' % (y))
-
         value = str(value) # value can be a string or an int
-        if not self.is_valid_symbol(value):
+        # One dict lookup both validates the symbol and converts it to its
+        # cell bitmask (EMPTY_SPACE maps to 0), with no int parsing.
+        cell = self._tables.symbol_cells.get(value)
+        if cell is None:
             raise SudokuBoardException('%r is not a valid symbol, symbols must be int or str between 1 and %s' % (value, self.size - 1))
 
-        old_value = self._board[x][y]
-        self._board[x][y] = value
+        size = self.size
+        try:
+            x, y = key
+            if not (0 <= x < size and 0 <= y < size):
+                raise SudokuBoardException('(%s, %s) index is out of range' % (x, y))
+            index = y * size + x
+            old_cell = self._cells[index]
+        except (TypeError, ValueError):
+            raise SudokuBoardException('key must be a tuple of two integers')
 
         if self.strict:
-            if self.is_valid_board() == False:
-                self._board[x][y] = old_value # restore old value
+            # Check the assignment against the used-symbol masks before
+            # writing anything, so a rejected write has nothing to roll
+            # back. Masking out old_cell accounts for overwriting the
+            # space's own current symbol.
+            if self._used_masks_dirty:
+                self._rebuild_used_masks()
+            size_sqrt = self.size_sqrt
+            box = (y // size_sqrt) * size_sqrt + (x // size_sqrt)
+            row_used = self._row_used
+            col_used = self._col_used
+            box_used = self._box_used
+            if cell & (row_used[y] | col_used[x] | box_used[box]) & ~old_cell:
                 raise SudokuBoardException('strict mode is enabled, and this symbol assignment causes the board to become invalid')
+            if old_cell:
+                row_used[y] &= ~old_cell
+                col_used[x] &= ~old_cell
+                box_used[box] &= ~old_cell
+            row_used[y] |= cell
+            col_used[x] |= cell
+            box_used[box] |= cell
+        else:
+            self._used_masks_dirty = True
+
+        self._cells[index] = cell
+        self._dirty = True
+        self._str_cache = None
+        self._repr_cache = None
+
+
+    def _rebuild_used_masks(self):
+        """Rebuilds the used-symbol bitmasks of every row, column, and
+        subgrid from the cells, after writes were made while strict mode
+        (and therefore incremental mask upkeep) was off."""
+        size = self.size
+        size_sqrt = self.size_sqrt
+        row_used = self._row_used = [0] * size
+        col_used = self._col_used = [0] * size
+        box_used = self._box_used = [0] * size
+        for index, cell in enumerate(self._cells):
+            if cell:
+                y, x = divmod(index, size)
+                row_used[y] |= cell
+                col_used[x] |= cell
+                box_used[(y // size_sqrt) * size_sqrt + (x // size_sqrt)] |= cell
+        self._used_masks_dirty = False
+
+
+    def _rebuild_group_caches(self):
+        """Rebuilds the cached row, column, and subgrid views of the board
+        in a single pass. The caches are served by get_row(), get_column(),
+        and get_subgrid() until the board is modified again."""
+        size = self.size
+        table = self._tables.cell_symbols
+        symbols = [table[cell.bit_length()] for cell in self._cells]
+        self._row_cache = [symbols[start:start + size] for start in range(0, size * size, size)]
+        self._column_cache = [symbols[x::size] for x in range(size)]
+        self._subgrid_cache = [[symbols[index] for index in group]
+                               for group in self._tables.subgrid_indexes]
+
+        self._dirty = False
 
 
     def get_row(self, row):
-        if not isinstance(row, int) or row < 0 or row >= self.size:
-            raise SudokuBoardException('row must be an int between 0 and %s' % (self.size - 1))
+        size = self.size
+        if not isinstance(row, int) or row < 0 or row >= size:
+            raise SudokuBoardException('row must be an int between 0 and %s' % (size - 1))
 
-        return [self._board[x][row] for x in range(self.size)]
+        if self._dirty:
+            self._rebuild_group_caches()
+        return list(self._row_cache[row])
 
 
     def get_column(self, column):
-        if not isinstance(column, int) or column < 0 or column >= self.size:
-            raise SudokuBoardException('column must be an int between 0 and %s' % (self.size - 1))
+        size = self.size
+        if not isinstance(column, int) or column < 0 or column >= size:
+            raise SudokuBoardException('column must be an int between 0 and %s' % (size - 1))
 
-        return [self._board[column][y] for y in range(self.size)]
+        if self._dirty:
+            self._rebuild_group_caches()
+        return list(self._column_cache[column])
 
 
     def get_subgrid(self, subgrid_x, subgrid_y):
-        if not isinstance(subgrid_x, int) or subgrid_x < 0 or subgrid_x >= self.size_sqrt:
-            raise SudokuBoardException('subgrid_x must be an int between 0 and %s' % (self.size_sqrt - 1))
+        size_sqrt = self.size_sqrt
+        if not isinstance(subgrid_x, int) or subgrid_x < 0 or subgrid_x >= size_sqrt:
+            raise SudokuBoardException('subgrid_x must be an int between 0 and %s' % (size_sqrt - 1))
 
-        if not isinstance(subgrid_y, int) or subgrid_y < 0 or subgrid_y >= self.size_sqrt:
-            raise SudokuBoardException('subgrid_y must be an int between 0 and %s' % (self.size_sqrt - 1))
+        if not isinstance(subgrid_y, int) or subgrid_y < 0 or subgrid_y >= size_sqrt:
+            raise SudokuBoardException('subgrid_y must be an int between 0 and %s' % (size_sqrt - 1))
 
-        subgrid = []
-        start_x = subgrid_x * self.size_sqrt
-        start_y = subgrid_y * self.size_sqrt
-        for y in range(start_y, start_y + self.size_sqrt):
-            for x in range(start_x, start_x + self.size_sqrt):
-                subgrid.append(self._board[x][y])
-
-        return subgrid
+        if self._dirty:
+            self._rebuild_group_caches()
+        return list(self._subgrid_cache[subgrid_y * size_sqrt + subgrid_x])
 
 
     def get_symbols(self):
         """Returns a string or tuple of all size^2 symbols on the board.
 
         TODO"""
-        symbols = []
-        for y in range(self.size):
-            for x in range(self.size):
-                symbols.append(self._board[x][y])
-
+        # A cell's symbol is just its bit length looked up in the per-size
+        # table, so the whole board translates in one comprehension pass.
+        table = self._tables.cell_symbols
+        cells = self._cells
         if self.size <= 9:
             # Return the symbols as a string.
-            return ''.join(symbols)
+            return ''.join([table[cell.bit_length()] for cell in cells])
         else:
             # Otherwise, since the symbols can be multiple-digits long, return a tuple.
-            return tuple(symbols)
+            return tuple([table[cell.bit_length()] for cell in cells])
 
 
     def __str__(self):
@@ -296,42 +567,125 @@ class SudokuBoard(object):
         5 . . | 2 . . | . . .
         1 . 4 | . . . | . . .
         """
-        symbol_length = len(str(self.size_sqrt))
+        # The template with the separators baked in is cached per size, so
+        # rendering the board is a single str.format() call, memoized until
+        # the board is modified.
+        if self._str_cache is None:
+            self._str_cache = self._tables.render_template.format(*self.get_symbols())
+        return self._str_cache
 
-        all_rows = []
 
-        for y in range(self.size):
-            row = list(self.get_row(y))
+    def __repr__(self):
+        if self._repr_cache is None:
+            self._repr_cache = f'SudokuBoard(symbols={self.get_symbols()!r})'
+        return self._repr_cache
+
+
+    def __copy__(self):
+        # A copied board shares the immutable per-size tables and duplicates
+        # only the per-board state, skipping __init__ entirely.
+        board = object.__new__(type(self))
+        board.size = self.size
+        board.size_sqrt = self.size_sqrt
+        board._tables = self._tables
+        board._valid_symbols = self._valid_symbols
+        board.strict = self.strict
+        board._cells = self._cells[:]
+        board._row_used = self._row_used[:]
+        board._col_used = self._col_used[:]
+        board._box_used = self._box_used[:]
+        board._used_masks_dirty = self._used_masks_dirty
+        board._dirty = True
+        board._row_cache = None
+        board._column_cache = None
+        board._subgrid_cache = None
+        board._str_cache = self._str_cache
+        board._repr_cache = self._repr_cache
+        return board
+
+
+    @classmethod
+    def empty(cls, size=9, strict=True):
+        """Returns a new empty board of the given size, copied from a cached
+        prototype so repeated construction skips the size validation and
+        table setup that __init__() does."""
+        prototype = _EMPTY_PROTOTYPES.get(size)
+        if prototype is None:
+            # Go through SudokuBoard (not cls) so the 9x9 case still gets
+            # the specialized subclass from __new__().
+            prototype = _EMPTY_PROTOTYPES[size] = SudokuBoard(size=size)
+        board = copy.copy(prototype)
+        board.strict = strict
+        return board
 
-            # Add vertical separators to the row.
-            for i in range(self.size - 1 - self.size_sqrt, -1, -self.size_sqrt):
-                row.insert(i + 1, '|')
 
-            # Go through the row and make sure it is properly spaced if
-            # symbols can have multiple digits.
-            if self.size > 9:
-                for i, symbol in enumerate(row):
-                    row[i] = symbol.rjust(symbol_length)
+    def solve(self):
+        pass
 
-            all_rows.append(' '.join(row))
 
-            # Add a horizontal separator, if needed.
-            if (y + 1) % self.size_sqrt == 0 and y != (self.size - 1):
-                all_rows.append('-' * (symbol_length * self.size_sqrt + self.size_sqrt) +
-                                '+' +
-                                '-' * (symbol_length * self.size_sqrt + self.size_sqrt + 1) +
-                                '+' +
-                                '-' * (symbol_length * self.size_sqrt + self.size_sqrt))
+# The flat cell indexes of every row, column, and subgrid on a 9x9 board,
+# bound to a module global so that _SudokuBoard9.is_valid_board() doesn't
+# even pay the cached-table function call.
+_GROUPS_9 = _all_group_indexes(9)
+
+
+# The rendered string of an empty 9x9 board as ASCII bytes, and the byte
+# offsets within it where each of the 81 cell symbols goes. With these,
+# _SudokuBoard9.__str__() renders by patching bytes into a copy of the
+# skeleton instead of formatting a template.
+_STR_SKELETON_9 = _render_template(9).format(*([EMPTY_SPACE] * 81)).encode('ascii')
+_STR_CELL_OFFSETS_9 = tuple(offset for offset, byte in enumerate(_STR_SKELETON_9)
+                            if byte == ord(EMPTY_SPACE))
+
+
+def _make_is_valid_board_9():
+    """Generates a fully unrolled is_valid_board() for the 9x9 size from
+    the _GROUPS_9 table: every one of the 27 groups becomes straight-line
+    OR-and-test statements on fixed cell indexes, with no loops or group
+    iteration left at all. Generated and compiled once at import."""
+    lines = ['def is_valid_board(self):', '    c = self._cells']
+    for group in _GROUPS_9:
+        lines.append('    seen = c[%d]' % (group[0]))
+        for index in group[1:]:
+            lines.append('    if seen & c[%d]:' % (index))
+            lines.append('        return False')
+            lines.append('    seen |= c[%d]' % (index))
+    lines.append('    return True')
+
+    namespace = {}
+    exec(compile('\n'.join(lines), '<generated is_valid_board>', 'exec'), namespace)
+    function = namespace['is_valid_board']
+    function.__doc__ = ("""Returns True if the board is in a valid state (even if incomplete),
+        otherwise return False if the board has invalid symbols set to any of the
+        spaces.""")
+    return function
 
-        return '\n'.join(all_rows)
 
+class _SudokuBoard9(SudokuBoard):
+    """A SudokuBoard specialized for the default 9x9 size. The board size
+    constants are baked into the methods instead of being looked up on self,
+    and validation runs as code generated from the precomputed _GROUPS_9
+    table. SudokuBoard.__new__() returns an instance of this class when size
+    is 9."""
 
-    def __repr__(self):
-        return "SudokuBoard(symbols=%r)" % (self.get_symbols(),)
+    # The setters only allow valid symbols on the board, so the generated
+    # validator only has to check for repeats within each group.
+    is_valid_board = _make_is_valid_board_9()
 
 
-    def solve(self):
-        pass
+    def __str__(self):
+        # Patch the cell symbols into a copy of the prerendered skeleton:
+        # 81 byte stores and one decode, with no formatting machinery. A
+        # zero cell keeps the skeleton's EMPTY_SPACE byte.
+        if self._str_cache is None:
+            rendered = bytearray(_STR_SKELETON_9)
+            cells = self._cells
+            for i, offset in enumerate(_STR_CELL_OFFSETS_9):
+                cell = cells[i]
+                if cell:
+                    rendered[offset] = 48 + cell.bit_length() # ord('0') + digit
+            self._str_cache = rendered.decode('ascii')
+        return self._str_cache
 
 
 class SudokuBoardException(Exception):
@@ -342,9 +696,11 @@ class SudokuBoardException(Exception):
     pass
 
 
-b1 = SudokuBoard(symbols='53..7....6..195....98....6.8...6...34..8.3..17...2...6.6....28....419..5....8..79')
-b2 = SudokuBoard(symbols='534678912672195348198342567859761423426853791713924856961537284287419635345286179')
-
-
 if __name__ == '__main__':
+    # Some sample SudokuBoard objects for testing/debugging purposes. These
+    # aren't built at import time so that importers don't pay for their
+    # construction.
+    b1 = SudokuBoard(symbols='53..7....6..195....98....6.8...6...34..8.3..17...2...6.6....28....419..5....8..79')
+    b2 = SudokuBoard(symbols='534678912672195348198342567859761423426853791713924856961537284287419635345286179')
+
     doctest.testmod()
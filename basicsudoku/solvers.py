@@ -1,4 +1,5 @@
-import copy
+import array
+import collections
 import os
 import sys
 import time
@@ -8,10 +9,89 @@ sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), '..')
 
 from basicsudoku import SudokuBoard, SudokuBoardException, BOARD_LENGTH, BOARD_LENGTH_SQRT, EMPTY_SPACE, FULL_BOARD_SIZE
 
+# A candidate mask with all nine digit bits set: bit i means digit i + 1 is
+# still a possible symbol for that space.
+ALL_CANDIDATES = (1 << BOARD_LENGTH) - 1
+
+# The 27 units of the board (9 rows, 9 columns, 9 boxes) as tuples of flat
+# row-major board indexes, and for every space the 20 peers that share at
+# least one unit with it. Both are built once at import so the propagation
+# loops just walk a table instead of recomputing row/column/box arithmetic.
+UNITS = tuple(
+    [tuple(y * BOARD_LENGTH + x for x in range(BOARD_LENGTH)) for y in range(BOARD_LENGTH)] +
+    [tuple(y * BOARD_LENGTH + x for y in range(BOARD_LENGTH)) for x in range(BOARD_LENGTH)] +
+    [tuple((box_y * BOARD_LENGTH_SQRT + dy) * BOARD_LENGTH + box_x * BOARD_LENGTH_SQRT + dx
+           for dy in range(BOARD_LENGTH_SQRT) for dx in range(BOARD_LENGTH_SQRT))
+     for box_y in range(BOARD_LENGTH_SQRT) for box_x in range(BOARD_LENGTH_SQRT)]
+)
+PEERS = tuple(tuple(sorted(set(i for unit in UNITS if index in unit for i in unit) - {index}))
+              for index in range(FULL_BOARD_SIZE))
+
+# The three units (row, column, box) that each space belongs to.
+UNITS_OF = tuple(tuple(unit for unit in UNITS if index in unit) for index in range(FULL_BOARD_SIZE))
+
+# The digit bit for each symbol string, for one-time conversion of symbols
+# to candidate bits at the public-API boundary.
+DIGIT_BIT = dict((str(digit), 1 << (digit - 1)) for digit in range(1, BOARD_LENGTH + 1))
+
+# The symbol that each possible candidate mask renders as: the digit if
+# exactly one bit is set, EMPTY_SPACE otherwise.
+_MASK_TO_SYMBOL = tuple(str(mask.bit_length()) if mask != 0 and mask & (mask - 1) == 0 else EMPTY_SPACE
+                        for mask in range(1 << BOARD_LENGTH))
+
+# The number of set bits in each possible candidate mask. Indexing a bytes
+# object is much cheaper than bin(mask).count('1'), which builds a new
+# string on every call.
+_POPCOUNT = bytes(bin(mask).count('1') for mask in range(1 << BOARD_LENGTH))
+
+# How many known-dead-end candidate states the search remembers at most,
+# so the memo's memory use stays flat on pathological puzzles.
+_DEAD_END_CACHE_SIZE = 10000
+
+
+def _candidates_are_consistent(candidates):
+    """Returns True if a flat list of 81 candidate masks could still lead
+    to a solution: no space is out of candidates, every digit has at least
+    one place left in every unit, and no two solved spaces in a unit hold
+    the same digit. A unit check is just a few integer ops on the masks.
+    This is a debugging aid for the propagation code (for use in asserts
+    or from a debugger); nothing on the solving path calls it."""
+    for unit in UNITS:
+        combined = 0
+        solved = 0
+        for i in unit:
+            mask = candidates[i]
+            if mask == 0:
+                return False # this space has no candidates left
+            combined |= mask
+            if mask & (mask - 1) == 0:
+                if solved & mask:
+                    return False # two spaces in this unit hold the same digit
+                solved |= mask
+        if combined != ALL_CANDIDATES:
+            return False # some digit has no place left in this unit
+    return True
+
 
 class BasicSolver(object):
-    def __init__(self, board):
+    # The candidate state is kept in instance attributes rather than being
+    # threaded through the propagation methods as arguments, and __slots__
+    # makes reading those attributes a fixed-offset load instead of a
+    # __dict__ lookup in the hot loops.
+    __slots__ = ('board', '_candidates', '_dead_ends', 'last_solve_time')
+
+    def __init__(self, board, memoize_dead_ends=True):
         self.board = board
+        # Hard puzzles can reach the same candidate state through different
+        # guess orders; remembering states that were searched and found
+        # unsolvable lets the search skip those subtrees. The memo is kept
+        # in insertion order and bounded, evicting the oldest entries. Pass
+        # memoize_dead_ends=False to skip the per-state hashing on easy
+        # puzzles where the search barely backtracks.
+        if memoize_dead_ends:
+            self._dead_ends = collections.OrderedDict()
+        else:
+            self._dead_ends = None
         self.solve()
 
 
@@ -32,16 +112,32 @@ class BasicSolver(object):
 
         start_time = time.time()
 
-        # Each of the 81 spaces on the board has a set of all 9 symbols as
-        # candidates for the real symbol that belongs at that space. When this
-        # list is reduced to one symbol, we know we've solved that space.
-        board_candidates = [[set('123456789') for j in range(BOARD_LENGTH)] for i in range(BOARD_LENGTH)]
+        # Each of the 81 spaces on the board has a 9-bit mask of the symbols
+        # that are still candidates for the real symbol that belongs at that
+        # space (bit i set means digit i + 1 is possible). When this mask is
+        # reduced to a single bit, we know we've solved that space. The masks
+        # are kept in a flat row-major list: the space at (x, y) is at index
+        # y * 9 + x. Compared to a 9x9 grid of sets of character candidates,
+        # the masks turn every membership test, removal, and copy into plain
+        # integer operations with no hashing or per-element allocation.
+        self._candidates = [ALL_CANDIDATES] * FULL_BOARD_SIZE
 
         # Remove the given symbols that the board started with.
-        self.remove_givens_from_board_candidates(board_candidates)
-
-        # Search through all the remaining possibilities.
-        solution_symbols = self.solve_through_search(board_candidates)
+        self.remove_givens_from_board_candidates()
+
+        # Search through all the remaining possibilities. When numpy and
+        # numba are installed, the search runs as a compiled kernel instead
+        # of the pure-Python recursion.
+        from basicsudoku import _kernels
+        if _kernels.HAS_COMPILED_SOLVER:
+            solved_masks = _kernels.solve_candidate_masks(self._candidates)
+            if solved_masks is None:
+                solution_symbols = None
+            else:
+                self._candidates = solved_masks
+                solution_symbols = self.symbols_from_candidates()
+        else:
+            solution_symbols = self.solve_through_search()
 
         self.last_solve_time = time.time() - start_time
 
@@ -53,143 +149,482 @@ class BasicSolver(object):
             return False
 
 
-    def remove_givens_from_board_candidates(self, board_candidates):
+    def remove_givens_from_board_candidates(self):
         """Remove the givens from all peer spaces. This function modifies
-        board_candidates in place."""
+        self._candidates in place."""
         for x in range(BOARD_LENGTH):
             for y in range(BOARD_LENGTH):
                 symbol = self.board[x, y]
                 if symbol != EMPTY_SPACE:
-                    self.set_symbol(symbol, board_candidates, x, y)
-
+                    self.set_symbol_bit(DIGIT_BIT[symbol], x, y)
+
+
+    def set_symbol(self, symbol, symbol_x, symbol_y):
+        """Set the symbol at the space at symbol_x symbol_y, then remove that
+        symbol as a candidate from all the peers of that space. The symbol is
+        converted to its digit bit here, once, at the boundary; everything
+        below this works on int bits only."""
+        self.set_symbol_bit(DIGIT_BIT[str(symbol)], symbol_x, symbol_y)
+
+
+    def set_symbol_bit(self, bit, symbol_x, symbol_y):
+        """Set the digit bit as the only candidate of the space at symbol_x
+        symbol_y, then remove it from all the peers of that space. This may
+        cause other spaces to become solved, which will then call
+        set_symbol_bit() again. This function modifies self._candidates in
+        palce."""
+        self._candidates[symbol_y * BOARD_LENGTH + symbol_x] = bit # ensure that the candidates only have this bit here
+        self.remove_bit_from_peers(bit, symbol_x, symbol_y)
+
+
+    def remove_from_peers(self, candidate, candidate_x, candidate_y):
+        """Remove the candidate symbol from the 20 peer spaces (the other
+        spaces in the same row, column, and box) of candidate_x candidate_y.
+        This function modifies self._candidates in place."""
+        self.remove_bit_from_peers(DIGIT_BIT[str(candidate)], candidate_x, candidate_y)
+
+
+    def remove_bit_from_peers(self, bit, candidate_x, candidate_y,
+                              PEERS=PEERS, BOARD_LENGTH=BOARD_LENGTH):
+        """Remove the candidate digit bit from the 20 peer spaces of
+        candidate_x candidate_y. This function modifies self._candidates in
+        place. (The trailing keyword parameters just bind the module-level
+        tables as locals; don\'t pass them.)"""
+        for peer_index in PEERS[candidate_y * BOARD_LENGTH + candidate_x]:
+            self.remove_candidate_bit(bit, peer_index)
+
+
+    def remove_candidate(self, candidate, index):
+        """Removes the candidate symbol from self._candidates at the space
+        with the given flat index. This function modifies self._candidates in
+        place."""
+        self.remove_candidate_bit(DIGIT_BIT[str(candidate)], index)
+
+
+    def remove_candidate_bit(self, bit, index,
+                             UNITS_OF=UNITS_OF, BOARD_LENGTH=BOARD_LENGTH):
+        """Removes the candidate digit bit from self._candidates at the space
+        with the given flat index. This function modifies self._candidates in
+        place. (The trailing keyword parameters just bind the module-level
+        tables as locals; don\'t pass them.)"""
+
+        candidates = self._candidates
+        mask = candidates[index]
+        if mask & bit:
+            mask &= ~bit
+            candidates[index] = mask
+            if mask & (mask - 1) == 0:
+                if mask == 0:
+                    raise SudokuBoardException('removing this candidate causes the board to be invalid')
+                # There is only one possible candidate for this space, menaing
+                # we've solved another space. Remove its bit from the space's
+                # peers.
+                self.set_symbol_bit(mask, index % BOARD_LENGTH, index // BOARD_LENGTH)
+
+            # Hidden single: the removed candidate may now have only one
+            # possible place left in this space's row, column, or box, in
+            # which case that place must be where the digit goes even though
+            # the place itself still has several candidates.
+            for unit in UNITS_OF[index]:
+                places = 0
+                for i in unit:
+                    if candidates[i] & bit:
+                        places += 1
+                        place_index = i
+                        if places > 1:
+                            break
+                if places == 0:
+                    # The digit has nowhere left to go in this unit.
+                    raise SudokuBoardException('removing this candidate causes the board to be invalid')
+                if places == 1 and candidates[place_index] != bit:
+                    self.set_symbol_bit(bit, place_index % BOARD_LENGTH, place_index // BOARD_LENGTH)
+
+
+    def solve_through_search(self, _POPCOUNT=_POPCOUNT, BOARD_LENGTH=BOARD_LENGTH):
+        """Attempts a brute-force search of the possible solutions for the
+        board, and returns when found. The search runs on an explicit stack
+        of frames instead of recursion, so a deep search doesn\'t pay
+        Python\'s per-frame call overhead or risk the recursion limit. (The
+        trailing keyword parameters just bind the module-level tables as
+        locals; don\'t pass them.)"""
+
+        board_candidates = self._candidates
+        dead_ends = self._dead_ends
+
+        # Each frame on the stack is a list of [bits_left, space, snapshot,
+        # state_key]: the candidate bits still to try for the chosen space,
+        # a snapshot of the whole candidate state to restore before each
+        # try, and the snapshot\'s memo key (None if memoization is off).
+        stack = []
+
+        while True:
+            # The candidate state is at a propagation fixed point here. If
+            # the memo remembers it as a dead end from an earlier guess
+            # order, skip straight to backtracking instead of re-searching
+            # the whole doomed subtree.
+            state_key = None
+            state_is_dead = False
+            if dead_ends is not None:
+                state_key = array.array('H', board_candidates).tobytes()
+                if state_key in dead_ends:
+                    dead_ends.move_to_end(state_key) # a fresh hit; keep it from evicting
+                    state_is_dead = True
+
+            if not state_is_dead:
+                # Check the space with the fewest candidates, to minimize the
+                # overall number of checks needed. (Don\'t include spaces that
+                # only have one candidate, i.e. spaces that are solved.) A single
+                # min-tracking pass that stops early at two candidates, since
+                # that\'s the fewest an unsolved space can have.
+                space_to_check = -1
+                fewest_candidates = BOARD_LENGTH + 1
+                for i, mask in enumerate(board_candidates):
+                    candidate_count = _POPCOUNT[mask]
+                    if 1 < candidate_count < fewest_candidates:
+                        space_to_check = i
+                        fewest_candidates = candidate_count
+                        if candidate_count == 2:
+                            break
+
+                if space_to_check == -1:
+                    # All the spaces have been solved, so lets just return the symbols that they form.
+                    return self.symbols_from_candidates()
+
+                stack.append([board_candidates[space_to_check], space_to_check, board_candidates[:], state_key])
+
+            # Try the next untried candidate of the topmost frame, popping
+            # exhausted frames (i.e. backtracking) as needed. Every state
+            # that survives propagation is valid by construction, since
+            # elimination removes an assigned digit from all 20 peers and
+            # raises as soon as any space runs out of candidates.
+            advanced = False
+            while stack and not advanced:
+                bits_left, space, snapshot, snapshot_key = stack[-1]
+                if bits_left == 0:
+                    # Every candidate failed, so the snapshot state is now a
+                    # known dead end; remember it, evicting the oldest entry
+                    # if the memo is full. Then backtrack.
+                    if snapshot_key is not None:
+                        dead_ends[snapshot_key] = None
+                        if len(dead_ends) > _DEAD_END_CACHE_SIZE:
+                            dead_ends.popitem(last=False)
+                    stack.pop()
+                    continue
+                bit = bits_left & -bits_left # the lowest candidate bit left
+                stack[-1][0] = bits_left & ~bit
+                board_candidates[:] = snapshot
+                board_candidates[space] = bit
+                try:
+                    self.remove_bit_from_peers(bit, space % BOARD_LENGTH, space // BOARD_LENGTH)
+                except SudokuBoardException:
+                    # Propagation emptied some space\'s candidates, so this
+                    # candidate cannot be the solution; try the next one.
+                    continue
+                advanced = True
+
+            if not stack:
+                # Exhausted all possible candidates and could not find a solution.
+                return None
+
+
+    def symbols_from_candidates(self):
+        """Returns the candidates as an 81-character symbols string, with
+        each solved space as its digit and every other space as
+        EMPTY_SPACE."""
+        return ''.join([_MASK_TO_SYMBOL[mask] for mask in self._candidates])
+
+
+    def make_board_from_candidates(self):
+        """Returns a SudokuBoard object, with the symbols set wherever the
+        candidates have only one possible candidate."""
+        return SudokuBoard(symbols=self.symbols_from_candidates(), strict=False)
+
+
+def _dlx_columns_of_row(row_id):
+    """Returns the four exact-cover constraint column indexes for a choice
+    row (the row_id encodes a space and a digit placed there): the space
+    being filled, and the digit appearing once in the space\'s row, column,
+    and box."""
+    space, digit = divmod(row_id, BOARD_LENGTH)
+    x = space % BOARD_LENGTH
+    y = space // BOARD_LENGTH
+    box = (y // BOARD_LENGTH_SQRT) * BOARD_LENGTH_SQRT + x // BOARD_LENGTH_SQRT
+    return (space,
+            FULL_BOARD_SIZE + y * BOARD_LENGTH + digit,
+            FULL_BOARD_SIZE * 2 + x * BOARD_LENGTH + digit,
+            FULL_BOARD_SIZE * 3 + box * BOARD_LENGTH + digit)
+
+
+# Node ids in the dancing-links arrays: id 0 is the root of the column-header
+# ring, ids 1 to 324 are the column headers, and the remaining ids are the
+# matrix\'s 1-entries, four consecutive ids per choice row.
+_DLX_HEADER_COUNT = 4 * FULL_BOARD_SIZE + 1
+_DLX_NODE_COUNT = _DLX_HEADER_COUNT + FULL_BOARD_SIZE * BOARD_LENGTH * 4
+
+# The pristine (no givens covered yet) dancing-links matrix, built on first
+# use and then just copied per solve. The matrix layout is the same for
+# every puzzle, so rebuilding the links for each DLXSolver would repeat the
+# same few thousand array stores on every solve.
+_DLX_TEMPLATE = None
+
+
+def _build_dlx_template():
+    """Builds the full 324-column, 729-row dancing-links matrix as six
+    parallel arrays: the left/right/up/down neighbor ids of every node,
+    each node\'s column header id, and the number of rows in each column."""
+    left = array.array('i', [0] * _DLX_NODE_COUNT)
+    right = array.array('i', [0] * _DLX_NODE_COUNT)
+    up = array.array('i', [0] * _DLX_NODE_COUNT)
+    down = array.array('i', [0] * _DLX_NODE_COUNT)
+    column_of = array.array('i', [0] * _DLX_NODE_COUNT)
+    size = array.array('i', [0] * _DLX_HEADER_COUNT)
+
+    # Link the root and the column headers into a ring, with each column
+    # initially empty (pointing up and down at itself).
+    for header in range(_DLX_HEADER_COUNT):
+        left[header] = header - 1
+        right[header] = header + 1
+        up[header] = down[header] = column_of[header] = header
+    left[0] = _DLX_HEADER_COUNT - 1
+    right[_DLX_HEADER_COUNT - 1] = 0
+
+    node = _DLX_HEADER_COUNT
+    for row_id in range(FULL_BOARD_SIZE * BOARD_LENGTH):
+        first = node
+        for c in _dlx_columns_of_row(row_id):
+            header = c + 1
+            # Link the node to the bottom of its column.
+            up[node] = up[header]
+            down[node] = header
+            down[up[header]] = node
+            up[header] = node
+            column_of[node] = header
+            size[header] += 1
+            # Link the node into its row\'s ring.
+            if node == first:
+                left[node] = right[node] = node
+            else:
+                left[node] = left[first]
+                right[node] = first
+                right[left[first]] = node
+                left[first] = node
+            node += 1
+    return (left, right, up, down, column_of, size)
 
-    def set_symbol(self, symbol, board_candidates, symbol_x, symbol_y):
-        """Set the symbol on the solver's SudokuBoard object, then remove that
-        symbol from all the peers of the space at symbol_x symbol_y. This may
-        cause other spaces to become solved, which will then call set_symbol()
-        again. This function modifies board_candidates in palce."""
-        symbol = str(symbol)
-        board_candidates[symbol_x][symbol_y] = set(symbol) # ensure that the board_candidates only have this symbol here
-        self.remove_from_peers(symbol, board_candidates, symbol_x, symbol_y)
 
+class DLXSolver(object):
+    """Solves a SudokuBoard with Knuth\'s Dancing Links form of Algorithm X.
 
-    def remove_from_peers(self, candidate, board_candidates, candidate_x, candidate_y):
-        """Remove the candidate from the peer spaces of candidate_x candidate_y
-        in board_candidates. This function modifies board_candidates in place."""
-        candidate = str(candidate)
+    Sudoku maps onto an exact-cover problem with 324 constraint columns
+    (every space filled, and every digit appearing once per row, column, and
+    box) and 729 choice rows (every digit in every space). The matrix is
+    stored as parallel arrays of node ids rather than linked node objects:
+    entry i of the left/right/up/down arrays holds the id of node i\'s
+    neighbor in that direction. Covering a satisfied constraint splices its
+    column and conflicting rows out of the matrix with a handful of array
+    stores, and backtracking splices them back in, in reverse.
 
-        # Remove candidate from the row of the xy space.
-        for x in range(BOARD_LENGTH):
-            if x != candidate_x:
-                self.remove_candidate(board_candidates, candidate, x, candidate_y)
-
-        # Remove candidate from the column of the xy space.
-        for y in range(BOARD_LENGTH):
-            if y != candidate_y:
-                self.remove_candidate(board_candidates, candidate, candidate_x, y)
-
-        # Remove candidate from the box of the xy space.
-        box_x, box_y = candidate_x // 3, candidate_y // 3 # Get the top left space of the box.
-        start_x = box_x * BOARD_LENGTH_SQRT
-        start_y = box_y * BOARD_LENGTH_SQRT
-        for y in range(start_y, start_y + BOARD_LENGTH_SQRT):
-            for x in range(start_x, start_x + BOARD_LENGTH_SQRT):
-                if x != candidate_x and y != candidate_y:
-                    self.remove_candidate(board_candidates, candidate, x, y)
-
-
-    def remove_candidate(self, board_candidates, candidate, x, y):
-        """Removes the candidate symbol from board_candidates at the x y space. This
-         function modifies board_candidates in place."""
-
-        if candidate in board_candidates[x][y]:
-            board_candidates[x][y].remove(candidate)
-            if len(board_candidates[x][y]) == 1:
-                # There is only one possible candidate for this space, menaing
-                # we've solved another space. Remove the symbol from the space's
-                # peers.
-                remaining_symbol = tuple(board_candidates[x][y])[0]
-                self.set_symbol(remaining_symbol, board_candidates, x, y)
-            elif len(board_candidates[x][y]) == 0:
-                raise SudokuBoardException('removing this candidate causes the board to be invalid')
+    Used the same way as BasicSolver:
 
+        solver = DLXSolver(board) # the board is solved in-place
+    """
 
-    def solve_through_search(self, board_candidates):
-        """Attempts a brute-force search of the possible solutions for the
-        board, and returns when found."""
-
-        # Check the space with the fewest candidates, to minimize the overall
-        # number of checks needed. (Don't include spaces that only have one
-        # candidate, i.e. spaces that are solved.)
-        order_of_spaces_to_check = [i for i in range(FULL_BOARD_SIZE) if len(board_candidates[i % BOARD_LENGTH][i // BOARD_LENGTH]) != 1]
-        order_of_spaces_to_check.sort(key=lambda i: len(board_candidates[i % BOARD_LENGTH][i // BOARD_LENGTH]), reverse=False)
-        if len(order_of_spaces_to_check) == 0:
-            # All the spaces have been solved, so lets just return the symbols that they form.
-            return self.make_board_from_candidates(board_candidates).symbols
-        space_to_check = order_of_spaces_to_check[0]
-
-        x, y = space_to_check % BOARD_LENGTH, space_to_check // BOARD_LENGTH
-        candidates = board_candidates[x][y]
-
-        assert len(candidates) > 0, 'board_candidates[%s][%s] has no candidates, which should never happen' % (x, y)
-
-        # Loop through all possible candidates for this space.
-        for candidate in candidates:
-            # This function is recursive, and testing each candidate in each
-            # call will need its own board_candidates.
-            board_candidates_copy = copy.deepcopy(board_candidates)
-
-            # Set this candidate as the only possible candidate in the copy
-            # of board_candidates, then test to see if the board it produces
-            # is valid.
-            board_candidates_copy[x][y] = set(candidate)
-            try:
-                self.remove_from_peers(candidate, board_candidates_copy, x, y)
-            except SudokuBoardException:
-                # Removing that candidate from the peers has caused a space to
-                # have zero candidates, meaning the board will be in an invalid
-                # state. So this candidate cannot be the solution and we should
-                # move on to the next candidate.
-                continue
+    __slots__ = ('board', '_left', '_right', '_up', '_down', '_column_of',
+                 '_size', '_covered', '_solution_rows', 'last_solve_time')
 
-            board = self.make_board_from_candidates(board_candidates_copy)
-            if not board.is_valid_board():
-                # This candidate causes the board to become invalid, so this is
-                # not the correct solution for this space. Continue on to the
-                # next candidate.
-                continue
+    def __init__(self, board):
+        self.board = board
+        self.solve()
 
-            # If the board is both valid and full, the whole board is solved.
-            if board.is_full():
-                return board.symbols # BASE CASE
 
-            # Continue searching.
-            result = self.solve_through_search(board_candidates_copy) # RECUSIVE CASE
-            if result is not None:
-                return result # BASE CASE
+    def solve(self):
+        """Solve the sudoku puzzle as given in self.board, which is set to a
+        SudokuBoard object passed to __init__(). Returns True if a solution
+        is found, otherwise returns False."""
 
-        # Exhausted all possible candidates and could not find a solution.
-        return None # BASE CASE
+        start_time = time.time()
 
+        self._build_matrix()
+        self._solution_rows = []
 
-    def make_board_from_candidates(self, board_candidates):
-        """Returns a SudokuBoard object, with the symbols set wherever the
-        board_candidates have only one possible candidate."""
-        symbols = []
+        # Cover the constraints satisfied by the symbols the board starts
+        # with. A given whose constraint is already covered contradicts an
+        # earlier given, so the board has no solution.
+        solvable = True
         for i in range(FULL_BOARD_SIZE):
-            x, y = i % BOARD_LENGTH, i // BOARD_LENGTH
-
-            assert len(board_candidates[x][y]) > 0, 'Somehow board_candidates at x %s, y %s has no candidates.' % (x, y)
-
-            if len(board_candidates[x][y]) == 1:
-                # If there is only one candidate, add it to the symbols list.
-                the_one_possible_candidate = tuple(board_candidates[x][y])[0]
-                symbols.append(the_one_possible_candidate)
+            symbol = self.board[i]
+            if symbol == EMPTY_SPACE:
+                continue
+            row_id = i * BOARD_LENGTH + int(symbol) - 1
+            for c in _dlx_columns_of_row(row_id):
+                header = c + 1
+                if self._covered[header]:
+                    solvable = False
+                    break
+                self._cover(header)
+            if not solvable:
+                break
+            self._solution_rows.append(row_id)
+
+        if solvable:
+            # Run the dance loop as a compiled kernel when numpy and numba
+            # are installed; the kernel works on this solver's arrays
+            # directly through zero-copy views.
+            from basicsudoku import _kernels
+            if _kernels.HAS_COMPILED_SOLVER:
+                searched_rows = _kernels.dlx_search(self._left, self._right, self._up,
+                                                    self._down, self._column_of, self._size)
+                solved = searched_rows is not None
+                if solved:
+                    self._solution_rows.extend(searched_rows)
             else:
-                # If there are multiple candidates, mark it as an empty space.
-                symbols.append(EMPTY_SPACE)
+                solved = self._search()
+        else:
+            solved = False
 
-        return SudokuBoard(symbols=''.join(symbols), strict=False)
+        if solved:
+            # Translate the chosen rows back into the 81 board symbols.
+            symbols = [EMPTY_SPACE] * FULL_BOARD_SIZE
+            for row_id in self._solution_rows:
+                space, digit = divmod(row_id, BOARD_LENGTH)
+                symbols[space] = str(digit + 1)
+            self.board.symbols = ''.join(symbols)
+
+        self.last_solve_time = time.time() - start_time
+        return solved
+
+
+    def _build_matrix(self):
+        """Sets up this solver\'s dancing-links arrays as copies of the
+        module-level template matrix, building the template on first use."""
+        global _DLX_TEMPLATE
+        if _DLX_TEMPLATE is None:
+            _DLX_TEMPLATE = _build_dlx_template()
+
+        left, right, up, down, column_of, size = _DLX_TEMPLATE
+        self._left = left[:]
+        self._right = right[:]
+        self._up = up[:]
+        self._down = down[:]
+        self._column_of = column_of[:]
+        self._size = size[:]
+        self._covered = bytearray(_DLX_HEADER_COUNT)
+
+
+    def _cover(self, column):
+        """Unlinks the column header and every row with a node in the column
+        from the matrix."""
+        left, right, up, down = self._left, self._right, self._up, self._down
+        column_of, size = self._column_of, self._size
+        self._covered[column] = 1
+        left[right[column]] = left[column]
+        right[left[column]] = right[column]
+        node = down[column]
+        while node != column:
+            row_node = right[node]
+            while row_node != node:
+                up[down[row_node]] = up[row_node]
+                down[up[row_node]] = down[row_node]
+                size[column_of[row_node]] -= 1
+                row_node = right[row_node]
+            node = down[node]
+
+
+    def _uncover(self, column):
+        """Relinks a covered column and its rows, exactly reversing what
+        _cover() did."""
+        left, right, up, down = self._left, self._right, self._up, self._down
+        column_of, size = self._column_of, self._size
+        node = up[column]
+        while node != column:
+            row_node = left[node]
+            while row_node != node:
+                size[column_of[row_node]] += 1
+                up[down[row_node]] = row_node
+                down[up[row_node]] = row_node
+                row_node = left[row_node]
+            node = up[node]
+        left[right[column]] = column
+        right[left[column]] = column
+        self._covered[column] = 0
+
+
+    def _search(self):
+        """Recursively covers the column with the fewest rows left, tries
+        each of its rows as part of the solution, and uncovers to backtrack.
+        Returns True once every column is covered."""
+        right, down, left = self._right, self._down, self._left
+        size, column_of = self._size, self._column_of
+
+        if right[0] == 0:
+            return True # every constraint is satisfied
+
+        # Choose the column with the fewest ways left to satisfy it.
+        best = right[0]
+        column = right[best]
+        while column != 0:
+            if size[column] < size[best]:
+                best = column
+            column = right[column]
+        if size[best] == 0:
+            return False # a constraint can no longer be satisfied
+
+        self._cover(best)
+        node = down[best]
+        while node != best:
+            self._solution_rows.append((node - _DLX_HEADER_COUNT) // 4)
+            row_node = right[node]
+            while row_node != node:
+                self._cover(column_of[row_node])
+                row_node = right[row_node]
+
+            if self._search():
+                return True # BASE CASE
+
+            # This row didn\'t lead to a solution; undo it and try the next.
+            self._solution_rows.pop()
+            row_node = left[node]
+            while row_node != node:
+                self._uncover(column_of[row_node])
+                row_node = left[row_node]
+            node = down[node]
+        self._uncover(best)
+        return False
+
+
+def _solve_one(symbols):
+    """Solves a single puzzle given as an 81-character symbols string and
+    returns the solved symbols string, or None if there's no solution. A
+    top-level function so it can be pickled for worker processes."""
+    try:
+        board = SudokuBoard(symbols=symbols)
+        solved = BasicSolver(board).solve()
+    except SudokuBoardException:
+        return None # the givens themselves are contradictory
+    if solved:
+        return board.symbols
+    return None
+
+
+def solve_many(puzzles):
+    """Solves an iterable of puzzles (each an 81-character symbols string)
+    in parallel across a pool of worker processes, one per CPU. Returns a
+    list of solved symbols strings in the same order as the input, with
+    None for any puzzle that has no solution. Each puzzle is independent,
+    so this scales nearly linearly with the number of cores."""
+    import concurrent.futures
+
+    puzzles = list(puzzles)
+    if len(puzzles) <= 1:
+        # Not worth spawning worker processes for a single puzzle.
+        return [_solve_one(symbols) for symbols in puzzles]
+
+    cpu_count = os.cpu_count() or 1
+    with concurrent.futures.ProcessPoolExecutor(max_workers=cpu_count) as executor:
+        # Batch the puzzles so each worker gets several per dispatch instead
+        # of paying the inter-process round trip for every puzzle.
+        chunksize = max(1, len(puzzles) // (4 * cpu_count))
+        return list(executor.map(_solve_one, puzzles, chunksize=chunksize))
 
 
 # Example usage of solving a board:
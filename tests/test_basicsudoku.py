@@ -5,6 +5,7 @@ import sys
 
 sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), '..')))
 import basicsudoku
+import basicsudoku.solvers
 
 runningOnPython2 = sys.version_info[0] == 2
 
@@ -12,6 +13,11 @@ SYMBOLS_FOR_AN_EMPTY_BOARD  = '.................................................
 SYMBOLS_FOR_A_PARTIAL_BOARD = '53..7....6..195....98....6.8...6...34..8.3..17...2...6.6....28....419..5....8..79'
 SYMBOLS_FOR_A_FULL_BOARD    = '534678912672195348198342567859761423426853791713924856961537284287419635345286179'
 
+# A valid board (no repeated symbols) that has no solution. The contradiction
+# is a few guesses deep, so the solvers disprove it quickly through search
+# rather than raising while propagating the givens.
+SYMBOLS_FOR_AN_UNSOLVABLE_BOARD = '..4.7.9.26721.5.4.1....2...8...........8..71..1.9.4...9.......4..7.1..353......7.'
+
 
 def test_ctor():
     # Test the basic constructor.
@@ -509,6 +515,69 @@ def test_boxes_iter():
 
 
 
+def test_basic_solver():
+    # Solving a puzzle fills in the board object in-place.
+    board = basicsudoku.SudokuBoard(symbols=SYMBOLS_FOR_A_PARTIAL_BOARD)
+    solver = basicsudoku.solvers.BasicSolver(board) # the constructor solves the board
+    assert board.symbols == SYMBOLS_FOR_A_FULL_BOARD
+    assert board.is_solved()
+    assert solver.solve() == True
+
+    # The dead-end memo is optional and doesn't change the result.
+    board = basicsudoku.SudokuBoard(symbols=SYMBOLS_FOR_A_PARTIAL_BOARD)
+    basicsudoku.solvers.BasicSolver(board, memoize_dead_ends=False)
+    assert board.symbols == SYMBOLS_FOR_A_FULL_BOARD
+
+    # An already-solved board stays solved.
+    board = basicsudoku.SudokuBoard(symbols=SYMBOLS_FOR_A_FULL_BOARD)
+    basicsudoku.solvers.BasicSolver(board)
+    assert board.symbols == SYMBOLS_FOR_A_FULL_BOARD
+
+    # An unsolvable board is reported as such and left unchanged.
+    board = basicsudoku.SudokuBoard(symbols=SYMBOLS_FOR_AN_UNSOLVABLE_BOARD)
+    solver = basicsudoku.solvers.BasicSolver(board)
+    assert solver.solve() == False
+    assert board.symbols == SYMBOLS_FOR_AN_UNSOLVABLE_BOARD
+
+
+def test_dlx_solver():
+    # Solving a puzzle fills in the board object in-place.
+    board = basicsudoku.SudokuBoard(symbols=SYMBOLS_FOR_A_PARTIAL_BOARD)
+    solver = basicsudoku.solvers.DLXSolver(board) # the constructor solves the board
+    assert board.symbols == SYMBOLS_FOR_A_FULL_BOARD
+    assert board.is_solved()
+    assert solver.solve() == True
+
+    # An already-solved board stays solved.
+    board = basicsudoku.SudokuBoard(symbols=SYMBOLS_FOR_A_FULL_BOARD)
+    basicsudoku.solvers.DLXSolver(board)
+    assert board.symbols == SYMBOLS_FOR_A_FULL_BOARD
+
+    # An unsolvable board is reported as such and left unchanged.
+    board = basicsudoku.SudokuBoard(symbols=SYMBOLS_FOR_AN_UNSOLVABLE_BOARD)
+    solver = basicsudoku.solvers.DLXSolver(board)
+    assert solver.solve() == False
+    assert board.symbols == SYMBOLS_FOR_AN_UNSOLVABLE_BOARD
+
+
+def test_solve_many():
+    # Results come back in input order, with None for unsolvable puzzles.
+    results = basicsudoku.solvers.solve_many([
+        SYMBOLS_FOR_A_PARTIAL_BOARD,
+        SYMBOLS_FOR_AN_UNSOLVABLE_BOARD,
+        SYMBOLS_FOR_A_FULL_BOARD,
+        SYMBOLS_FOR_A_PARTIAL_BOARD,
+    ])
+    assert results == [SYMBOLS_FOR_A_FULL_BOARD, None, SYMBOLS_FOR_A_FULL_BOARD, SYMBOLS_FOR_A_FULL_BOARD]
+
+    # Single puzzles and empty input are solved without worker processes.
+    assert basicsudoku.solvers.solve_many([SYMBOLS_FOR_A_PARTIAL_BOARD]) == [SYMBOLS_FOR_A_FULL_BOARD]
+    assert basicsudoku.solvers.solve_many([]) == []
+
+    # Contradictory givens don't crash the batch; they come back as None.
+    assert basicsudoku.solvers.solve_many(['1' * 81]) == [None]
+
+
 def test_barebones():
     # These tests aren't thorough, but they will at least offer complete coverage.
     board = basicsudoku.BareBonesSudokuBoard('53..7....6..195....98....6.8...6...34..8.3..17...2...6.6....28....419..5....8..79')